@@ -296,7 +296,25 @@ def stage(path: str):
 @click.option("--message", "-m", required=True, help="The commit message.")
 @click.option("--author-name", default=None, help="The name of the author.")
 @click.option("--author-email", default=None, help="The email of the author.")
-def commit(message: str, author_name: str, author_email: str):
+@click.option(
+    "--full-scan",
+    is_flag=True,
+    default=False,
+    help="Rebuild the tree by scanning the entire working directory.",
+)
+@click.option(
+    "--durability",
+    type=click.Choice(["normal", "strict"]),
+    default="normal",
+    help="Flush strategy: 'strict' fsyncs the commit before returning.",
+)
+def commit(
+    message: str,
+    author_name: str,
+    author_email: str,
+    full_scan: bool,
+    durability: str,
+):
     """Create a new commit with the staged changes.
 
     This command creates a new commit object with the staged changes,
@@ -312,7 +330,13 @@ def commit(message: str, author_name: str, author_email: str):
             author_email = "user@example.com"
 
         # Create the commit using the commit module
-        make_commit(message, author_name, author_email)
+        make_commit(
+            message,
+            author_name,
+            author_email,
+            full_scan=full_scan,
+            durability=durability,
+        )
     except Exception as e:
         # Log the error and exit
         logger.error(f"Error creating commit: {str(e)}")
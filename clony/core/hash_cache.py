@@ -0,0 +1,207 @@
+"""
+Persistent blob hash cache for Clony.
+
+This module caches previously computed blob hashes keyed by each file's stat
+signature, so repeated commits only re-hash files whose content changed.
+"""
+
+# Standard library imports
+import atexit
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Tuple
+
+# Local imports
+from clony.utils.logger import logger
+
+# Maximum number of cached hashes before least-recently-used eviction
+MAX_CACHE_ENTRIES = 1_000_000
+
+# In-process caches keyed by repository path, guarded by a lock because
+# blob hashing runs in a thread pool during tree construction
+_loaded_caches: dict = {}
+_cache_lock = threading.Lock()
+
+# Repositories whose in-process cache has unsaved entries; persisting is
+# deferred to flush_hash_cache so each store only touches the dict
+_dirty_repos: set = set()
+
+
+# Function to get the cache file path
+def _cache_file(repo_path: Path) -> Path:
+    """
+    Return the path of the persistent hash cache file.
+
+    Args:
+        repo_path (Path): Path to the repository.
+
+    Returns:
+        Path: Path to the .git/clony_hash_cache file.
+    """
+
+    # Return the cache file path inside the .git directory
+    return repo_path / ".git" / "clony_hash_cache"
+
+
+# Function to load the hash cache for a repository
+def _load_cache(repo_path: Path) -> OrderedDict:
+    """
+    Load the hash cache for a repository, reading it from disk once.
+
+    Args:
+        repo_path (Path): Path to the repository.
+
+    Returns:
+        OrderedDict: The cache mapping stat keys to SHA-1 hashes.
+    """
+
+    # Return the already loaded cache if present
+    cache_key = str(repo_path)
+    cache = _loaded_caches.get(cache_key)
+    if cache is not None:
+        return cache
+
+    # Read the pickled cache from disk, tolerating a missing or corrupt file
+    cache = OrderedDict()
+    cache_file = _cache_file(repo_path)
+    if cache_file.exists():
+        try:
+            cache = OrderedDict(pickle.loads(cache_file.read_bytes()))
+        except Exception:
+            # A corrupt cache is only a lost optimization; start fresh
+            logger.debug(f"Discarding unreadable hash cache: {cache_file}")
+            cache = OrderedDict()
+
+    # Remember and return the loaded cache
+    _loaded_caches[cache_key] = cache
+    return cache
+
+
+# Function to persist the hash cache for a repository
+def _save_cache(repo_path: Path, cache: OrderedDict) -> None:
+    """
+    Persist the hash cache for a repository to disk.
+
+    Args:
+        repo_path (Path): Path to the repository.
+        cache (OrderedDict): The cache to persist.
+    """
+
+    # Write the pickled cache, tolerating a read-only .git directory
+    try:
+        _cache_file(repo_path).write_bytes(pickle.dumps(dict(cache)))
+    except OSError:
+        # A cache that cannot be written is only a lost optimization
+        logger.debug(f"Could not persist hash cache for: {repo_path}")
+
+
+# Function to build a cache key from a file's stat result
+def make_cache_key(file_path: Path, file_stat: os.stat_result) -> Tuple:
+    """
+    Build a cache key from a file path and its stat result.
+
+    The key pairs the path with the stat signature Git itself trusts, so a
+    touched, resized or replaced file never matches a stale entry.
+
+    Args:
+        file_path (Path): Path to the file.
+        file_stat (os.stat_result): The stat result for the file.
+
+    Returns:
+        Tuple: The cache key for the file.
+    """
+
+    # Combine the path with the stat signature
+    return (
+        str(file_path),
+        file_stat.st_mtime_ns,
+        file_stat.st_size,
+        file_stat.st_ino,
+    )
+
+
+# Function to look up a cached hash
+def get_cached_hash(repo_path: Path, cache_key: Tuple) -> Optional[str]:
+    """
+    Look up a previously computed hash for a file's stat signature.
+
+    Args:
+        repo_path (Path): Path to the repository.
+        cache_key (Tuple): The cache key built by make_cache_key.
+
+    Returns:
+        Optional[str]: The cached SHA-1 hash, or None on a miss.
+    """
+
+    # Look up the key and refresh its recency under the lock
+    with _cache_lock:
+        cache = _load_cache(repo_path)
+        sha1_hash = cache.get(cache_key)
+        if sha1_hash is not None:
+            cache.move_to_end(cache_key)
+
+    # Return the cached hash or None
+    return sha1_hash
+
+
+# Function to store a computed hash
+def store_hash(repo_path: Path, cache_key: Tuple, sha1_hash: str) -> None:
+    """
+    Store a computed hash and mark the cache for a deferred flush.
+
+    Persisting is left to flush_hash_cache so a commit that hashes many
+    blobs serializes the cache once instead of once per blob.
+
+    Args:
+        repo_path (Path): Path to the repository.
+        cache_key (Tuple): The cache key built by make_cache_key.
+        sha1_hash (str): The SHA-1 hash to cache.
+    """
+
+    # Store the entry, evict the oldest ones and mark dirty under the lock
+    with _cache_lock:
+        cache = _load_cache(repo_path)
+        cache[cache_key] = sha1_hash
+        cache.move_to_end(cache_key)
+        while len(cache) > MAX_CACHE_ENTRIES:
+            cache.popitem(last=False)
+        _dirty_repos.add(str(repo_path))
+
+
+# Function to flush unsaved cache entries for a repository
+def flush_hash_cache(repo_path: Path) -> None:
+    """
+    Persist the hash cache for a repository if it has unsaved entries.
+
+    Args:
+        repo_path (Path): Path to the repository.
+    """
+
+    # Persist the cache once and clear the dirty mark under the lock
+    with _cache_lock:
+        cache_key = str(repo_path)
+        if cache_key not in _dirty_repos:
+            return
+        cache = _loaded_caches.get(cache_key)
+        if cache is not None:
+            _save_cache(repo_path, cache)
+        _dirty_repos.discard(cache_key)
+
+
+# Function to flush every repository with unsaved cache entries
+def _flush_all() -> None:
+    """
+    Persist all hash caches with unsaved entries at process exit.
+    """
+
+    # Flush each dirty repository; the per-repo flush takes the lock
+    for cache_key in list(_dirty_repos):
+        flush_hash_cache(Path(cache_key))
+
+
+# Persist any unflushed entries when the process exits, covering callers
+# that hash blobs outside the commit flow
+atexit.register(_flush_all)
@@ -7,16 +7,39 @@ and commit objects.
 
 # Standard library imports
 import hashlib
+import mmap
 import os
 import stat
 import time
 import zlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Union
 
 # Local imports
+from clony.core.hash_cache import get_cached_hash, make_cache_key, store_hash
 from clony.utils.logger import logger
 
+# Optional dependency: ISA-L provides SIMD-accelerated DEFLATE with the same
+# wire format as zlib, so objects stay readable by stock decompressors
+try:
+    from isal import isal_zlib as zlib_impl
+except ImportError:
+    zlib_impl = zlib
+
+# Size threshold (in bytes) above which blob files are streamed through mmap
+# instead of being read fully into memory. Tiny files skip the mmap setup cost.
+LARGE_BLOB_THRESHOLD = 64 * 1024
+
+# Compression level 1 matches Git's speed-over-size default for loose objects
+COMPRESSION_LEVEL = 1
+
+# Local timezone offset, formatted once per process for commit timestamps
+_TZ_SUFFIX = time.strftime("%z")
+
+# Factory for streaming compressor objects, shared with the large-blob path
+COMPRESSOR = zlib_impl.compressobj
+
 
 # Function to calculate the SHA-1 hash of the content
 def calculate_sha1_hash(content: bytes) -> str:
@@ -37,10 +60,45 @@ def calculate_sha1_hash(content: bytes) -> str:
     return sha1_hash
 
 
+# Function to calculate the SHA-1 hash of a file with a prefixed header
+def calculate_sha1_hash_of_file(file_path: Path, header: bytes) -> str:
+    """
+    Calculate the SHA-1 hash of a header followed by a file's content.
+
+    On Python 3.11+ this uses hashlib.file_digest, which reads the file into
+    a reusable buffer and updates the digest with the GIL released, hitting
+    the fastest SHA-1 implementation the OpenSSL backend provides.
+
+    Args:
+        file_path (Path): Path to the file to hash.
+        header (bytes): The object header to prepend to the file content.
+
+    Returns:
+        str: The SHA-1 hash as a hex string.
+    """
+
+    # Initialize the digest with the header
+    sha1 = hashlib.sha1()
+    sha1.update(header)
+
+    # Feed the file content into the digest
+    with open(file_path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):
+            # Stream the file through the digest with the GIL released
+            hashlib.file_digest(f, lambda: sha1)
+        else:
+            # Chunked fallback for Python versions without file_digest
+            for chunk in iter(lambda: f.read(65536), b""):
+                sha1.update(chunk)
+
+    # Return the SHA-1 hash
+    return sha1.hexdigest()
+
+
 # Function to compress content using zlib
 def compress_content(content: bytes) -> bytes:
     """
-    Compress content using zlib.
+    Compress content using the fastest available zlib implementation.
 
     Args:
         content (bytes): The content to compress.
@@ -49,8 +107,72 @@ def compress_content(content: bytes) -> bytes:
         bytes: The compressed content.
     """
 
-    # Compress the content using zlib
-    return zlib.compress(content)
+    # Compress the content at Git's loose-object level
+    return zlib_impl.compress(content, COMPRESSION_LEVEL)
+
+
+# Function to write object content chunks into place with minimal syscalls
+def _write_object_chunks(
+    object_file_path: Union[str, Path], chunks: List[bytes]
+) -> None:
+    """
+    Write the compressed chunks of an object file to disk.
+
+    On Linux the chunks are written with a single os.writev to an anonymous
+    O_TMPFILE descriptor that is then linked into its final name, so no
+    intermediate temp name ever appears in the directory. Elsewhere the
+    chunks are written to a temporary file and atomically renamed.
+
+    Args:
+        object_file_path (Union[str, Path]): Final path of the object file.
+        chunks (List[bytes]): The compressed content chunks to write.
+    """
+
+    # Coerce to a plain string path once
+    object_file_path = os.fspath(object_file_path)
+
+    # Linux fast path: anonymous temp file + vectored write + link into place
+    if hasattr(os, "O_TMPFILE"):
+        try:
+            fd = os.open(
+                os.path.dirname(object_file_path), os.O_TMPFILE | os.O_WRONLY, 0o444
+            )
+        except OSError:
+            # The filesystem does not support O_TMPFILE; use the portable path
+            fd = None
+
+        if fd is not None:
+            try:
+                # Write all chunks, looping on the remainder of any short
+                # write (signal interruption or the kernel per-call cap)
+                # so the file is complete before it gets a name
+                pending = [memoryview(chunk) for chunk in chunks]
+                while pending:
+                    written = os.writev(fd, pending)
+                    while pending and written >= len(pending[0]):
+                        written -= len(pending[0])
+                        pending.pop(0)
+                    if written:
+                        pending[0] = pending[0][written:]
+
+                # Link the anonymous file into its final name
+                os.link(f"/proc/self/fd/{fd}", object_file_path)
+                return
+            except FileExistsError:
+                # Another writer materialized the identical object first
+                return
+            except OSError:
+                # Linking via /proc is not available here; use the
+                # portable path below
+                pass
+            finally:
+                os.close(fd)
+
+    # Portable fallback: temporary file plus atomic rename
+    temp_file_path = object_file_path + ".tmp"
+    with open(temp_file_path, "wb") as temp_file:
+        temp_file.write(b"".join(chunks))
+    os.replace(temp_file_path, object_file_path)
 
 
 # Function to write the object file
@@ -74,25 +196,78 @@ def write_object_file(repo_path: Path, content: bytes, object_type: str) -> str:
     # Calculate the SHA-1 hash of the content
     sha1_hash = calculate_sha1_hash(store_content)
 
+    # Build the object paths with plain string operations: this runs once
+    # per object, where Path construction and wrappers add up
+    object_subdir = os.path.join(os.fspath(repo_path), ".git", "objects", sha1_hash[:2])
+    os.makedirs(object_subdir, exist_ok=True)
+    object_file_path = os.path.join(object_subdir, sha1_hash[2:])
+
+    # Short-circuit before compressing: an existing object is identical
+    if os.path.exists(object_file_path):
+        # Log the existence of the object file
+        logger.debug(f"Object file already exists: {object_file_path}")
+        return sha1_hash
+
     # Compress the content
     compressed_content = compress_content(store_content)
 
-    # Define the object directory
-    object_dir = repo_path / ".git" / "objects"
+    # Write the compressed content to the object file
+    _write_object_chunks(object_file_path, [compressed_content])
+
+    # Log the write operation
+    logger.debug(f"Wrote {object_type} object file: {object_file_path}")
+
+    # Return the SHA-1 hash
+    return sha1_hash
+
+
+# Function to write a blob object by streaming the file through mmap
+def write_blob_object_streaming(repo_path: Path, file_path: Path) -> str:
+    """
+    Write a blob object for a large file by streaming it through mmap.
+
+    The file is memory-mapped so that the SHA-1 hash and the zlib compression
+    both read directly from the kernel page cache, avoiding a full in-memory
+    copy of the file content.
 
-    # Create the object directory if it doesn't exist
-    object_subdir = object_dir / sha1_hash[:2]
-    object_subdir.mkdir(parents=True, exist_ok=True)
-    object_file_path = object_subdir / sha1_hash[2:]
+    Args:
+        repo_path (Path): Path to the repository.
+        file_path (Path): Path to the file.
+
+    Returns:
+        str: The SHA-1 hash of the blob object.
+    """
+
+    # Prepare the blob header from the file size
+    file_size = os.path.getsize(file_path)
+    header = f"blob {file_size}\0".encode()
+
+    # Calculate the SHA-1 hash without materializing the file in memory
+    sha1_hash = calculate_sha1_hash_of_file(file_path, header)
+
+    # Build the object paths with plain string operations
+    object_subdir = os.path.join(os.fspath(repo_path), ".git", "objects", sha1_hash[:2])
+    os.makedirs(object_subdir, exist_ok=True)
+    object_file_path = os.path.join(object_subdir, sha1_hash[2:])
 
     # Write the compressed content to the object file if it doesn't exist
-    if not object_file_path.exists():
-        # Write the compressed content to the object file
-        with open(object_file_path, "wb") as f:
-            f.write(compressed_content)
+    if not os.path.exists(object_file_path):
+        # Memory-map the file so compression reads from the page cache
+        with open(file_path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+                # Compress the header and the mapped content incrementally
+                compressor = COMPRESSOR(COMPRESSION_LEVEL)
+                chunks = [
+                    compressor.compress(header),
+                    compressor.compress(mapped_file),
+                    compressor.flush(),
+                ]
+
+        # Write the compressed chunks into place
+        _write_object_chunks(object_file_path, chunks)
 
         # Log the write operation
-        logger.debug(f"Wrote {object_type} object file: {object_file_path}")
+        logger.debug(f"Wrote blob object file: {object_file_path}")
     else:
         # Log the existence of the object file
         logger.debug(f"Object file already exists: {object_file_path}")
@@ -114,33 +289,94 @@ def create_blob_object(repo_path: Path, file_path: Path) -> str:
         str: The SHA-1 hash of the blob object.
     """
 
-    # Read the file content
-    with open(file_path, "rb") as f:
-        content = f.read()
+    # Check the hash cache against the file's current stat signature
+    file_stat = os.stat(file_path)
+    cache_key = make_cache_key(file_path, file_stat)
+    cached_hash = get_cached_hash(repo_path, cache_key)
+    if cached_hash is not None:
+        # Trust the cached hash only while the object file still exists
+        object_file_path = os.path.join(
+            os.fspath(repo_path), ".git", "objects", cached_hash[:2], cached_hash[2:]
+        )
+        if os.path.exists(object_file_path):
+            logger.debug(f"Using cached blob hash for: {file_path}")
+            return cached_hash
+
+    # Stream large files through mmap to avoid a full in-memory copy
+    if file_stat.st_size > LARGE_BLOB_THRESHOLD:
+        sha1_hash = write_blob_object_streaming(repo_path, file_path)
+    else:
+        # Read the file content
+        with open(file_path, "rb") as f:
+            content = f.read()
 
-    # Write the blob object
-    return write_object_file(repo_path, content, "blob")
+        # Write the blob object
+        sha1_hash = write_object_file(repo_path, content, "blob")
+
+    # Remember the hash for this stat signature
+    store_hash(repo_path, cache_key, sha1_hash)
+
+    # Return the SHA-1 hash
+    return sha1_hash
 
 
-# Function to create a tree entry
-def create_tree_entry(mode: str, name: str, sha1_hash: str) -> bytes:
+# Function to emit a tree body from parallel entry arrays
+def _emit_tree_content_py(
+    entry_modes: List[bytes],
+    entry_names: List[bytes],
+    entry_hashes: List[bytes],
+) -> bytes:
     """
-    Create a tree entry for a file or directory.
+    Emit a tree object body from parallel mode, name and hash arrays.
+
+    The body size is computed up front so a single bytearray covers the
+    whole tree, and each entry is written into it with slice assignment —
+    one allocation per tree instead of one per concatenation.
 
     Args:
-        mode (str): The file mode (e.g., "100644" for regular file).
-        name (str): The name of the file or directory.
-        sha1_hash (str): The SHA-1 hash of the blob or tree object.
+        entry_modes (List[bytes]): The file modes, in entry order.
+        entry_names (List[bytes]): The entry names, in entry order.
+        entry_hashes (List[bytes]): The raw SHA-1 hashes, in entry order.
 
     Returns:
-        bytes: The tree entry as bytes.
+        bytes: The tree object body.
     """
 
-    # Convert the SHA-1 hash from hex to binary
-    sha1_binary = bytes.fromhex(sha1_hash)
+    # Size the body up front: mode, space, name, NUL and 20 raw hash bytes
+    total_size = sum(
+        len(mode) + len(name) + 22
+        for mode, name in zip(entry_modes, entry_names)
+    )
+
+    # Fill a single preallocated buffer with slice assignment
+    tree_body = bytearray(total_size)
+    offset = 0
+    for mode, name, sha1_binary in zip(entry_modes, entry_names, entry_hashes):
+        # Write the mode and the separating space
+        tree_body[offset : offset + len(mode)] = mode
+        offset += len(mode)
+        tree_body[offset] = 0x20
+        offset += 1
+
+        # Write the name and the terminating NUL
+        tree_body[offset : offset + len(name)] = name
+        offset += len(name)
+        offset += 1
+
+        # Write the raw SHA-1 hash
+        tree_body[offset : offset + 20] = sha1_binary
+        offset += 20
+
+    # Return the body as immutable bytes
+    return bytes(tree_body)
+
 
-    # Create the tree entry
-    return f"{mode} {name}\0".encode() + sha1_binary
+# Optional compiled serializer: a clony._speedups extension can provide the
+# same two-pass emit (sum lengths, allocate once, copy) in C for large trees
+try:
+    from clony._speedups import emit_tree_content as _emit_tree_content
+except ImportError:
+    _emit_tree_content = _emit_tree_content_py
 
 
 # Function to create a tree object
@@ -165,13 +401,16 @@ def create_tree_object(
         # Default ignore patterns
         ignore_patterns = [".git"]
 
-    # Initialize tree entries
-    entries: List[Tuple[str, str, str]] = []
+    # Scan the directory once: DirEntry reuses the readdir type information
+    # and caches its stat result, avoiding repeated per-entry syscalls
+    with os.scandir(directory_path) as directory_iter:
+        dir_entries = sorted(directory_iter, key=lambda entry: entry.name.encode())
 
-    # Process all files and directories in the directory
-    for item in sorted(os.listdir(directory_path)):
+    # Collect the files and directories to process in sorted order
+    items: List[Tuple[str, str, Path, bool]] = []
+    for entry in dir_entries:
         # Get the item path
-        item_path = directory_path / item
+        item_path = directory_path / entry.name
 
         # Skip ignored patterns
         if any(
@@ -180,39 +419,62 @@ def create_tree_object(
         ):
             continue
 
-        # Get the file mode
-        item_stat = item_path.stat()
-
         # Check if the item is a file
-        if item_path.is_file():
-            # Regular file
+        if entry.is_file():
+            # Regular file, executable when the owner execute bit is set
             mode = "100644"
-            if item_stat.st_mode & stat.S_IXUSR:
+            if entry.stat().st_mode & stat.S_IXUSR:
                 # Executable file
                 mode = "100755"
 
-            # Create a blob object for the file
-            sha1_hash = create_blob_object(repo_path, item_path)
-
-            # Add the entry to the list
-            entries.append((mode, item, sha1_hash))
+            # Record the file item
+            items.append((mode, entry.name, item_path, True))
 
         # Check if the item is a directory
-        elif item_path.is_dir():
-            # Directory
-            mode = "40000"
-
-            # Create a tree object for the subdirectory
+        elif entry.is_dir():
+            # Record the directory item
+            items.append(("40000", entry.name, item_path, False))
+
+    # Hash the file blobs in parallel: hashlib and zlib both release the GIL
+    # for large buffers, so a thread pool scales across cores
+    file_paths = [item_path for _, _, item_path, is_file in items if is_file]
+    if len(file_paths) > 1:
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            blob_hashes = dict(
+                zip(
+                    [str(file_path) for file_path in file_paths],
+                    executor.map(
+                        lambda file_path: create_blob_object(repo_path, file_path),
+                        file_paths,
+                    ),
+                )
+            )
+    else:
+        # A single file does not justify the thread pool setup cost
+        blob_hashes = {
+            str(file_path): create_blob_object(repo_path, file_path)
+            for file_path in file_paths
+        }
+
+    # Build the tree entries in their original sorted order as three
+    # parallel arrays of modes, names and raw hashes
+    entry_modes: List[bytes] = []
+    entry_names: List[bytes] = []
+    entry_hashes: List[bytes] = []
+    for mode, item, item_path, is_file in items:
+        # Look up the blob hash or create the subtree object
+        if is_file:
+            sha1_hash = blob_hashes[str(item_path)]
+        else:
             sha1_hash = create_tree_object(repo_path, item_path, ignore_patterns)
 
-            # Add the entry to the list
-            entries.append((mode, item, sha1_hash))
+        # Append each component to its parallel array
+        entry_modes.append(mode.encode())
+        entry_names.append(item.encode())
+        entry_hashes.append(bytes.fromhex(sha1_hash))
 
-    # Create the tree content
-    tree_content = b""
-    for mode, name, sha1_hash in entries:
-        # Create the tree entry
-        tree_content += create_tree_entry(mode, name, sha1_hash)
+    # Emit the tree body with a single join
+    tree_content = _emit_tree_content(entry_modes, entry_names, entry_hashes)
 
     # Write the tree object
     return write_object_file(repo_path, tree_content, "tree")
@@ -243,24 +505,189 @@ def create_commit_object(
         str: The SHA-1 hash of the commit object.
     """
 
-    # Get the current timestamp
+    # Get the current timestamp; the timezone suffix is preformatted once
     timestamp = int(time.time())
-    timezone = time.strftime("%z")
 
-    # Create the author and committer strings
-    author = f"{author_name} <{author_email}> {timestamp} {timezone}"
-    committer = author  # Use the same author as committer for simplicity
+    # Create the author and committer line (the same person for simplicity)
+    author = f"author {author_name} <{author_email}> {timestamp} {_TZ_SUFFIX}".encode()
 
-    # Create the commit content
-    commit_content = f"tree {tree_hash}\n"
+    # Assemble the commit body with a single join
+    lines = [b"tree " + tree_hash.encode()]
     if parent_hash:
-        commit_content += f"parent {parent_hash}\n"
-    commit_content += f"author {author}\n"
-    commit_content += f"committer {committer}\n"
-    commit_content += f"\n{message}\n"
+        lines.append(b"parent " + parent_hash.encode())
+    lines.append(author)
+    lines.append(b"committer" + author[6:])
+    commit_content = b"\n".join(lines) + b"\n\n" + message.encode() + b"\n"
 
     # Write the commit object
-    return write_object_file(repo_path, commit_content.encode(), "commit")
+    return write_object_file(repo_path, commit_content, "commit")
+
+
+# Function to read the entries of a stored tree object
+def read_tree_entries(
+    repo_path: Path, tree_hash: str
+) -> List[Tuple[str, str, str, str]]:
+    """
+    Read and parse a tree object from the .git/objects directory.
+
+    Args:
+        repo_path (Path): Path to the repository.
+        tree_hash (str): The SHA-1 hash of the tree object.
+
+    Returns:
+        List[Tuple[str, str, str, str]]: The parsed tree entries, or an empty
+        list if the tree object does not exist.
+    """
+
+    # Define the tree object path
+    object_file_path = repo_path / ".git" / "objects" / tree_hash[:2] / tree_hash[2:]
+
+    # Return an empty list if the tree object does not exist
+    if not object_file_path.exists():
+        return []
+
+    # Read and decompress the tree object
+    decompressed_content = zlib.decompress(object_file_path.read_bytes())
+
+    # Strip the object header and parse the entries
+    null_index = decompressed_content.find(b"\0")
+    return parse_tree_object(decompressed_content[null_index + 1 :])
+
+
+# Function to build a tree level from staged changes and a parent tree
+def _build_tree_level(
+    repo_path: Path,
+    parent_tree_hash: Optional[str],
+    changes: dict,
+    directory_path: Path,
+) -> str:
+    """
+    Build one tree object by applying staged changes on top of a parent tree.
+
+    Args:
+        repo_path (Path): Path to the repository.
+        parent_tree_hash (Optional[str]): The SHA-1 hash of the corresponding
+            tree in the parent commit, or None if there is no parent tree.
+        changes (dict): Nested mapping of names to blob hashes (files) or
+            further mappings (subdirectories).
+        directory_path (Path): Path to the directory in the working tree.
+
+    Returns:
+        str: The SHA-1 hash of the new tree object.
+    """
+
+    # Load the parent tree entries so unchanged ones are reused as-is,
+    # remembering their order: tree objects store entries already sorted
+    entries = {}
+    parent_names: List[str] = []
+    if parent_tree_hash:
+        for mode, _, sha1_hash, name in read_tree_entries(repo_path, parent_tree_hash):
+            entries[name] = (mode, sha1_hash)
+            parent_names.append(name)
+
+    # Apply the staged changes for this directory level
+    for name, value in changes.items():
+        # Check if the change is a subdirectory
+        if isinstance(value, dict):
+            # Reuse the parent's subtree as the base if it exists
+            parent_subtree_hash = None
+            existing_entry = entries.get(name)
+            if existing_entry and existing_entry[0].startswith("40"):
+                parent_subtree_hash = existing_entry[1]
+
+            # Build the subtree and record the new entry
+            subtree_hash = _build_tree_level(
+                repo_path, parent_subtree_hash, value, directory_path / name
+            )
+            entries[name] = ("40000", subtree_hash)
+        else:
+            # Check if the staged file is still present in the working tree
+            item_path = directory_path / name
+            if item_path.is_file():
+                # Determine the file mode from the working tree
+                mode = "100644"
+                if item_path.stat().st_mode & stat.S_IXUSR:
+                    # Executable file
+                    mode = "100755"
+
+                # Create a blob object for the staged file
+                entries[name] = (mode, create_blob_object(repo_path, item_path))
+            else:
+                # Keep the staged blob hash for files no longer on disk
+                entries[name] = ("100644", value)
+
+    # Order the entry names: the parent entries arrive already sorted, so a
+    # batch of new names that all sort after them is appended in O(n)
+    # instead of re-sorting the combined list
+    new_names = sorted(set(changes) - set(parent_names))
+    if parent_names and new_names and parent_names[-1] < new_names[0]:
+        ordered_names = parent_names + new_names
+    else:
+        ordered_names = sorted(entries)
+
+    # Create the tree content from parallel arrays of the ordered entries
+    entry_modes: List[bytes] = []
+    entry_names: List[bytes] = []
+    entry_hashes: List[bytes] = []
+    for name in ordered_names:
+        mode, sha1_hash = entries[name]
+        entry_modes.append(mode.encode())
+        entry_names.append(name.encode())
+        entry_hashes.append(bytes.fromhex(sha1_hash))
+
+    # Emit the tree body with a single join
+    tree_content = _emit_tree_content(entry_modes, entry_names, entry_hashes)
+
+    # Write the tree object
+    return write_object_file(repo_path, tree_content, "tree")
+
+
+# Function to build the root tree from the index and the parent tree
+def build_tree_from_index(
+    repo_path: Path, parent_tree_hash: Optional[str], index_dict: dict
+) -> str:
+    """
+    Build the root tree object by applying only the staged paths on top of
+    the parent commit's tree.
+
+    Unchanged subtrees keep their parent hashes without being re-scanned or
+    re-hashed, so the work done is proportional to the number of staged
+    files instead of the size of the repository.
+
+    Args:
+        repo_path (Path): Path to the repository.
+        parent_tree_hash (Optional[str]): The SHA-1 hash of the parent
+            commit's root tree, or None if this is the first commit.
+        index_dict (dict): Dictionary mapping staged file paths to their
+            blob hashes.
+
+    Returns:
+        str: The SHA-1 hash of the new root tree object.
+    """
+
+    # Group the staged paths into a nested mapping of directories and files
+    changes: dict = {}
+    for file_path, sha1_hash in index_dict.items():
+        # Relativize absolute paths against the repository root
+        path_obj = Path(file_path)
+        if path_obj.is_absolute():
+            try:
+                path_obj = path_obj.relative_to(repo_path)
+            except ValueError:
+                # Skip staged paths that fall outside the repository
+                logger.debug(f"Skipping staged path outside repository: {file_path}")
+                continue
+
+        # Walk the nested mapping down to the file's directory
+        node = changes
+        for part in path_obj.parts[:-1]:
+            node = node.setdefault(part, {})
+
+        # Record the blob hash for the file
+        node[path_obj.parts[-1]] = sha1_hash
+
+    # Build the root tree level
+    return _build_tree_level(repo_path, parent_tree_hash, changes, repo_path)
 
 
 # Function to parse a tree object
@@ -6,8 +6,9 @@ and branches.
 """
 
 # Standard library imports
+import os
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 # Local imports
 from clony.utils.logger import logger
@@ -139,6 +140,58 @@ def get_head_commit(repo_path: Path) -> Optional[str]:
         return head_ref
 
 
+# Function to read HEAD and its commit with a single directory handle
+def refs_snapshot(repo_path: Path) -> Tuple[str, Optional[str]]:
+    """
+    Read the HEAD reference and the commit it resolves to in one pass.
+
+    The .git directory is opened once and both files are read relative to
+    that descriptor, so the commit finalization path pays two openat calls
+    instead of resolving the full repository path per file.
+
+    Args:
+        repo_path (Path): Path to the repository.
+
+    Returns:
+        Tuple[str, Optional[str]]: The HEAD reference (or raw hash when
+        detached) and the commit hash it resolves to, or None if the
+        reference has no commit yet.
+    """
+
+    # Fall back to the per-path readers where dir_fd is unsupported
+    if os.open not in os.supports_dir_fd:
+        return get_head_ref(repo_path), get_head_commit(repo_path)
+
+    # Open the .git directory once
+    dir_fd = os.open(repo_path / ".git", os.O_RDONLY)
+    try:
+        # Read the HEAD file relative to the directory descriptor
+        head_fd = os.open("HEAD", os.O_RDONLY, dir_fd=dir_fd)
+        try:
+            head_content = os.read(head_fd, 4096).decode().strip()
+        finally:
+            os.close(head_fd)
+
+        # A detached HEAD holds the commit hash directly
+        if not head_content.startswith("ref: "):
+            return head_content, head_content
+
+        # Read the referenced file, which may not exist before first commit
+        head_ref = head_content[5:]
+        try:
+            ref_fd = os.open(head_ref, os.O_RDONLY, dir_fd=dir_fd)
+        except FileNotFoundError:
+            return head_ref, None
+
+        # Read the commit hash from the reference file
+        try:
+            return head_ref, os.read(ref_fd, 4096).decode().strip()
+        finally:
+            os.close(ref_fd)
+    finally:
+        os.close(dir_fd)
+
+
 # Function to create a new branch
 def create_branch(
     repo_path: Path, branch_name: str, commit_hash: Optional[str] = None
@@ -5,30 +5,55 @@ This module handles the commit functionality for the Clony Git clone tool.
 """
 
 # Standard library imports
+import mmap
+import os
+import struct
 import sys
 from pathlib import Path
+from typing import Union
 
 # Third-party imports
 from rich.console import Console
 from rich.table import Table
 
 # Local imports
-from clony.core.objects import create_commit_object, create_tree_object
-from clony.core.refs import get_head_commit, get_head_ref, update_ref
-from clony.internals.staging import clear_staging_area, find_git_repo_path
+from clony.core.hash_cache import flush_hash_cache
+from clony.core.objects import (
+    build_tree_from_index,
+    create_commit_object,
+    create_tree_object,
+)
+from clony.core.refs import refs_snapshot, update_ref
+from clony.internals.log import parse_commit_object, read_git_object
+from clony.internals.staging import (
+    INDEX_ENTRY_FORMAT,
+    INDEX_ENTRY_HEADER_SIZE,
+    clear_staging_area,
+    find_git_repo_path,
+)
 from clony.utils.logger import logger
 
 # Create a console for rich text output
 console = Console()
 
+# In-process cache of parsed index files, keyed by path and guarded by the
+# file's stat signature so a rewritten index is re-parsed automatically
+_index_cache: dict = {}
+
 
 # Function to read the index file
-def read_index_file(index_file: Path) -> dict:
+def read_index_file(index_file: Union[str, Path]) -> dict:
     """
     Read the index file and return a dictionary of file paths and their SHA-1 hashes.
 
+    The index is stored as fixed-width binary records (raw SHA-1 followed by
+    the path length and path bytes) and is parsed through mmap to avoid
+    per-line string allocations. Parsed entries are cached in-process keyed
+    by the file's stat signature, so repeated reads of an unchanged index
+    skip the parse entirely.
+
     Args:
-        index_file (Path): Path to the .git/index file.
+        index_file (Union[str, Path]): Path to the .git/index file.
 
     Returns:
         dict: A dictionary mapping file paths to their SHA-1 hashes.
@@ -37,26 +62,126 @@ def read_index_file(index_file: Path) -> dict:
     # Initialize an empty dictionary
     index_dict = {}
 
-    # Check if the index file exists
-    if not index_file.exists():
+    # Coerce to a plain string path once; this function runs per command
+    index_path = os.fspath(index_file)
+
+    # Stat the index once, covering both the existence check and the cache
+    # signature; mmap also rejects empty files
+    try:
+        index_stat = os.stat(index_path)
+    except FileNotFoundError:
+        return index_dict
+    if index_stat.st_size == 0:
         return index_dict
 
-    # Read the index file
-    with open(index_file, "r") as f:
-        lines = f.readlines()
+    # Check the in-process cache against the file's stat signature
+    cache_key = index_path
+    signature = (index_stat.st_mtime_ns, index_stat.st_size)
+    cached = _index_cache.get(cache_key)
+    if cached is not None and cached[0] == signature:
+        # Log the cache hit and return a copy of the cached entries
+        logger.debug(f"Using cached index entries for: {index_file}")
+        return dict(cached[1])
+
+    # Memory-map the index file and walk the binary records
+    with open(index_path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped_index:
+            # Walk the buffer one fixed-width record at a time
+            offset = 0
+            while offset + INDEX_ENTRY_HEADER_SIZE <= len(mapped_index):
+                # Unpack the raw SHA-1 and the path length
+                sha1_binary, path_length = struct.unpack_from(
+                    INDEX_ENTRY_FORMAT, mapped_index, offset
+                )
+                offset += INDEX_ENTRY_HEADER_SIZE
+
+                # Slice the path bytes and advance the cursor
+                file_path = mapped_index[offset : offset + path_length].decode()
+                offset += path_length
+
+                # Store the entry with the hash converted back to hex
+                index_dict[file_path] = sha1_binary.hex()
+
+    # Cache the parsed entries for the next read of this index
+    _index_cache[cache_key] = (signature, dict(index_dict))
+
+    # Return the dictionary
+    return index_dict
+
+
+# Function to read the HEAD_TREE file
+def read_head_tree_file(head_tree_file: Path) -> dict:
+    """
+    Read the HEAD_TREE file and return a dictionary of file paths and hashes.
+
+    Unlike the index, the HEAD_TREE file keeps the simple text format of one
+    "path hash" pair per line.
+
+    Args:
+        head_tree_file (Path): Path to the .git/HEAD_TREE file.
+
+    Returns:
+        dict: A dictionary mapping file paths to their SHA-1 hashes.
+    """
+
+    # Initialize an empty dictionary
+    tree_dict = {}
+
+    # Check if the HEAD_TREE file exists
+    if not head_tree_file.exists():
+        return tree_dict
 
-    # Parse each line in the index file
-    for line in lines:
-        # Split the line into parts
-        parts = line.strip().split()
+    # Iterate the file object directly instead of materializing a line list
+    with open(head_tree_file, "r") as f:
+        for line in f:
+            # Split each line on the first space without extra allocations
+            file_path, _, sha1_hash = line.rstrip("\n").partition(" ")
 
-        # If the line has two parts, add them to the dictionary
-        if len(parts) == 2:
-            file_path, sha1_hash = parts
-            index_dict[file_path] = sha1_hash
+            # Keep only well-formed "path hash" pairs
+            if file_path and sha1_hash and " " not in sha1_hash:
+                tree_dict[file_path] = sha1_hash
 
     # Return the dictionary
-    return index_dict
+    return tree_dict
+
+
+# Function to flush a commit durably to disk
+def _flush_commit_to_disk(repo_path: Path, commit_hash: str, head_ref: str) -> None:
+    """
+    Force the commit object and the updated reference onto stable storage.
+
+    Object and ref writes normally rely on the operating system's writeback,
+    which keeps commits bandwidth-bound instead of fsync-bound. This helper
+    implements the opt-in strict mode by fsyncing only the end-of-commit
+    files: the commit object itself and the reference that points at it.
+
+    Args:
+        repo_path (Path): Path to the repository.
+        commit_hash (str): The SHA-1 hash of the new commit.
+        head_ref (str): The reference HEAD points to, or a raw hash when
+            HEAD is detached.
+    """
+
+    # Define the commit object file path
+    object_file = (
+        repo_path / ".git" / "objects" / commit_hash[:2] / commit_hash[2:]
+    )
+
+    # Define the reference file path (HEAD itself when detached)
+    if head_ref.startswith("refs/"):
+        ref_file = repo_path / ".git" / head_ref
+    else:
+        ref_file = repo_path / ".git" / "HEAD"
+
+    # Fsync each end-of-commit file that exists
+    for file_path in (object_file, ref_file):
+        if file_path.exists():
+            # Open the file and flush it to stable storage
+            fd = os.open(file_path, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
 
 
 # Function to display commit information in a tabular format
@@ -92,94 +217,172 @@ def display_commit_info(
         logger.error(f"Error displaying commit information: {str(e)}")
 
 
-# Function to create a commit
-def make_commit(message: str, author_name: str, author_email: str) -> str:
+# Custom exception for commit failures
+class CommitError(Exception):
     """
-    Create a commit with the staged changes.
+    Raised when a commit cannot be created.
+
+    The message is logged verbatim by make_commit before exiting.
+    """
+
+
+# Function implementing the commit, raising CommitError on failure
+def _make_commit_impl(
+    message: str,
+    author_name: str,
+    author_email: str,
+    full_scan: bool = False,
+    durability: str = "normal",
+) -> str:
+    """
+    Create a commit with the staged changes, raising on failure.
+
+    Runs without a surrounding try/except so the common no-error path pays
+    no exception-handling setup; make_commit translates CommitError into
+    the logged message and exit code.
 
     Args:
         message (str): The commit message.
         author_name (str): The name of the author.
         author_email (str): The email of the author.
+        full_scan (bool): If True, rebuild the tree by walking the entire
+            working directory instead of applying the staged paths on top
+            of the parent commit's tree. Defaults to False.
+        durability (str): "normal" leaves flushing to the operating
+            system's writeback; "strict" fsyncs the commit object and the
+            updated reference before returning. Defaults to "normal".
 
     Returns:
         str: The SHA-1 hash of the commit.
+
+    Raises:
+        CommitError: If there is no repository or nothing staged to commit.
     """
 
-    try:
-        # Find the repository path
-        repo_path = find_git_repo_path(Path.cwd())
-        if not repo_path:
-            logger.error("Not a git repository. Run 'clony init' to create one.")
-            sys.exit(1)
-
-        # Define the index file path
-        index_file = repo_path / ".git" / "index"
-
-        # Check if the index file exists
-        if not index_file.exists():
-            logger.error(
-                "Nothing to commit. Run 'clony stage <file>' to stage changes."
-            )
-            sys.exit(1)
-
-        # Read the index file
-        index_dict = read_index_file(index_file)
-
-        # Check if there are any staged changes
-        if not index_dict:
-            logger.error(
-                "Nothing to commit. Run 'clony stage <file>' to stage changes."
-            )
-            sys.exit(1)
-
-        # Create a tree object for the root directory
-        tree_hash = create_tree_object(repo_path, repo_path)
+    # Find the repository path
+    repo_path = find_git_repo_path(Path.cwd())
+    if not repo_path:
+        raise CommitError("Not a git repository. Run 'clony init' to create one.")
 
-        # Get the current HEAD commit
-        parent_hash = get_head_commit(repo_path)
+    # Define the index file path
+    index_file = repo_path / ".git" / "index"
 
-        # Create a commit object
-        commit_hash = create_commit_object(
-            repo_path, tree_hash, parent_hash, author_name, author_email, message
+    # Check if the index file exists
+    if not index_file.exists():
+        raise CommitError(
+            "Nothing to commit. Run 'clony stage <file>' to stage changes."
         )
 
-        # Update the current branch reference
-        head_ref = get_head_ref(repo_path)
-        if head_ref.startswith("refs/"):
-            update_ref(repo_path, head_ref, commit_hash)
-        else:
-            # Update HEAD directly (detached HEAD state)
-            with open(repo_path / ".git" / "HEAD", "w") as f:
-                f.write(commit_hash + "\n")
+    # Read the index file
+    index_dict = read_index_file(index_file)
+
+    # Check if there are any staged changes
+    if not index_dict:
+        raise CommitError(
+            "Nothing to commit. Run 'clony stage <file>' to stage changes."
+        )
+
+    # Read HEAD and the current commit with one directory handle
+    head_ref, parent_hash = refs_snapshot(repo_path)
+
+    # Build the tree for the commit
+    if full_scan:
+        # Walk the entire working tree
+        tree_hash = create_tree_object(repo_path, repo_path)
+    else:
+        # Look up the parent commit's root tree for reuse
+        parent_tree_hash = None
+        if parent_hash:
+            object_type, commit_content = read_git_object(repo_path, parent_hash)
+            if object_type == "commit":
+                parent_tree_hash = parse_commit_object(commit_content)["tree"]
+
+        # Apply only the staged paths on top of the parent tree
+        tree_hash = build_tree_from_index(repo_path, parent_tree_hash, index_dict)
+
+    # Create a commit object
+    commit_hash = create_commit_object(
+        repo_path, tree_hash, parent_hash, author_name, author_email, message
+    )
+
+    # Update the current branch reference
+    if head_ref.startswith("refs/"):
+        update_ref(repo_path, head_ref, commit_hash)
+    else:
+        # Update HEAD directly (detached HEAD state)
+        with open(repo_path / ".git" / "HEAD", "w") as f:
+            f.write(commit_hash + "\n")
 
-        # Get existing tracked files from HEAD_TREE if it exists
-        head_tree_file = repo_path / ".git" / "HEAD_TREE"
-        existing_tracked_files = {}
-        if head_tree_file.exists():
-            existing_tracked_files = read_index_file(head_tree_file)
+    # Flush the commit durably when strict durability is requested
+    if durability == "strict":
+        _flush_commit_to_disk(repo_path, commit_hash, head_ref)
 
-        # Merge existing tracked files with newly committed files
-        tracked_files = {**existing_tracked_files, **index_dict}
+    # Get existing tracked files from HEAD_TREE if it exists
+    head_tree_file = repo_path / ".git" / "HEAD_TREE"
+    existing_tracked_files = {}
+    if head_tree_file.exists():
+        existing_tracked_files = read_head_tree_file(head_tree_file)
 
-        # Update the HEAD_TREE file to track all committed files
-        with open(head_tree_file, "w") as f:
-            # Write the tracked files to the HEAD_TREE file
-            for file_path, file_hash in tracked_files.items():
-                f.write(f"{file_path} {file_hash}\n")
+    # Merge existing tracked files with newly committed files
+    tracked_files = {**existing_tracked_files, **index_dict}
 
-        # Log the successful commit
-        logger.debug(f"Updated HEAD_TREE file with {len(tracked_files)} files")
+    # Update the HEAD_TREE file to track all committed files
+    with open(head_tree_file, "w") as f:
+        # Write the tracked files to the HEAD_TREE file
+        for file_path, file_hash in tracked_files.items():
+            f.write(f"{file_path} {file_hash}\n")
 
-        # Display commit information in tabular format
-        display_commit_info(commit_hash, message, author_name, author_email)
+    # Log the successful commit
+    logger.debug(f"Updated HEAD_TREE file with {len(tracked_files)} files")
 
-        # Clear the staging area after successful commit
-        clear_staging_area(repo_path)
+    # Display commit information in tabular format
+    display_commit_info(commit_hash, message, author_name, author_email)
 
-        # Return the commit hash
-        return commit_hash
+    # Clear the staging area after successful commit
+    clear_staging_area(repo_path)
 
+    # Persist any blob hashes computed during this commit in one write
+    flush_hash_cache(repo_path)
+
+    # Return the commit hash
+    return commit_hash
+
+
+# Function to create a commit
+def make_commit(
+    message: str,
+    author_name: str,
+    author_email: str,
+    full_scan: bool = False,
+    durability: str = "normal",
+) -> str:
+    """
+    Create a commit with the staged changes.
+
+    Args:
+        message (str): The commit message.
+        author_name (str): The name of the author.
+        author_email (str): The email of the author.
+        full_scan (bool): If True, rebuild the tree by walking the entire
+            working directory instead of applying the staged paths on top
+            of the parent commit's tree. Defaults to False.
+        durability (str): "normal" leaves flushing to the operating
+            system's writeback; "strict" fsyncs the commit object and the
+            updated reference before returning. Defaults to "normal".
+
+    Returns:
+        str: The SHA-1 hash of the commit.
+    """
+
+    try:
+        # Create the commit through the raising implementation
+        return _make_commit_impl(
+            message, author_name, author_email, full_scan, durability
+        )
+    except CommitError as e:
+        # Log the failure message and exit
+        logger.error(str(e))
+        sys.exit(1)
     except Exception as e:
         # Log the error and exit
         logger.error(f"Error creating commit: {str(e)}")
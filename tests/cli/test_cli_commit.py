@@ -79,7 +79,48 @@ def test_commit_command(temp_dir: pathlib.Path):
         )
         assert result.exit_code == 0
         mock_commit.assert_called_once_with(
-            "Test commit message", "Test Author", "test@example.com"
+            "Test commit message",
+            "Test Author",
+            "test@example.com",
+            full_scan=False,
+            durability="normal",
+        )
+
+
+# Test for the commit command with strict durability
+@pytest.mark.cli
+def test_commit_command_strict_durability(temp_dir: pathlib.Path):
+    """
+    Test the commit command with the strict durability option.
+
+    Args:
+        temp_dir: Path to the temporary directory.
+    """
+
+    # Initialize a git repository in the temp directory
+    runner = CliRunner()
+    result = runner.invoke(cli, ["init", str(temp_dir)])
+    assert result.exit_code == 0
+
+    # Run the commit command with strict durability
+    with patch("clony.cli.make_commit") as mock_commit:
+        result = runner.invoke(
+            cli,
+            [
+                "commit",
+                "--message",
+                "Test commit message",
+                "--durability",
+                "strict",
+            ],
+        )
+        assert result.exit_code == 0
+        mock_commit.assert_called_once_with(
+            "Test commit message",
+            "Clony User",
+            "user@example.com",
+            full_scan=False,
+            durability="strict",
         )
 
 
@@ -111,7 +152,11 @@ def test_commit_command_default_author(temp_dir: pathlib.Path):
         result = runner.invoke(cli, ["commit", "--message", "Test commit message"])
         assert result.exit_code == 0
         mock_commit.assert_called_once_with(
-            "Test commit message", "Clony User", "user@example.com"
+            "Test commit message",
+            "Clony User",
+            "user@example.com",
+            full_scan=False,
+            durability="normal",
         )
 
 
@@ -0,0 +1,200 @@
+"""
+Tests for the blob hash cache functionality.
+
+This module contains tests for the hash_cache module, including cache keys,
+lookups, persistence and eviction.
+"""
+
+# Standard library imports
+import os
+import pathlib
+import shutil
+import tempfile
+from typing import Generator
+from unittest.mock import patch
+
+# Third-party imports
+import pytest
+
+# Local imports
+from clony.core import hash_cache
+from clony.core.hash_cache import (
+    flush_hash_cache,
+    get_cached_hash,
+    make_cache_key,
+    store_hash,
+)
+from clony.core.repository import Repository
+
+
+# Test fixture for creating a temporary repository
+@pytest.fixture
+def temp_dir() -> Generator[pathlib.Path, None, None]:
+    """
+    Create a temporary repository for testing.
+
+    Yields:
+        pathlib.Path: Path to the temporary repository.
+    """
+
+    # Create a temporary directory
+    temp_path = pathlib.Path(tempfile.mkdtemp())
+
+    # Initialize a repository so the .git directory exists
+    repo = Repository(str(temp_path))
+    repo.init()
+
+    # Drop any in-process cache state from earlier tests
+    hash_cache._loaded_caches.clear()
+    hash_cache._dirty_repos.clear()
+
+    # Yield the temporary repository path
+    yield temp_path
+
+    # Clean up the temporary directory and the in-process caches
+    hash_cache._loaded_caches.clear()
+    hash_cache._dirty_repos.clear()
+    shutil.rmtree(temp_path)
+
+
+# Test for make_cache_key function
+@pytest.mark.unit
+def test_make_cache_key(temp_dir: pathlib.Path):
+    """
+    Test the make_cache_key function.
+    """
+
+    # Create a test file
+    test_file_path = temp_dir / "test_file.txt"
+    test_file_path.write_text("test content")
+
+    # Build a cache key from the file's stat result
+    file_stat = os.stat(test_file_path)
+    cache_key = make_cache_key(test_file_path, file_stat)
+
+    # Assert that the key pairs the path with the stat signature
+    assert cache_key == (
+        str(test_file_path),
+        file_stat.st_mtime_ns,
+        file_stat.st_size,
+        file_stat.st_ino,
+    )
+
+
+# Test for storing and retrieving a hash
+@pytest.mark.unit
+def test_store_and_get_hash(temp_dir: pathlib.Path):
+    """
+    Test storing a hash and retrieving it from the cache.
+    """
+
+    # Define a cache key and a hash
+    cache_key = ("some/file.txt", 1, 2, 3)
+    sha1_hash = "a" * 40
+
+    # Assert that an unknown key is a miss
+    assert get_cached_hash(temp_dir, cache_key) is None
+
+    # Store the hash and assert that the lookup now hits
+    store_hash(temp_dir, cache_key, sha1_hash)
+    assert get_cached_hash(temp_dir, cache_key) == sha1_hash
+
+    # Assert that persisting is deferred until the cache is flushed
+    cache_file = temp_dir / ".git" / "clony_hash_cache"
+    assert not cache_file.exists()
+    flush_hash_cache(temp_dir)
+    assert cache_file.exists()
+
+    # Assert that a second flush with no new entries is a no-op
+    cache_file.unlink()
+    flush_hash_cache(temp_dir)
+    assert not cache_file.exists()
+
+
+# Test for reloading a persisted cache from disk
+@pytest.mark.unit
+def test_cache_persists_across_processes(temp_dir: pathlib.Path):
+    """
+    Test that a persisted cache is reloaded from disk.
+    """
+
+    # Store a hash, flush it and drop the in-process cache
+    cache_key = ("some/file.txt", 1, 2, 3)
+    store_hash(temp_dir, cache_key, "b" * 40)
+    flush_hash_cache(temp_dir)
+    hash_cache._loaded_caches.clear()
+
+    # Assert that the lookup hits after reloading from disk
+    assert get_cached_hash(temp_dir, cache_key) == "b" * 40
+
+
+# Test for a corrupt cache file
+@pytest.mark.unit
+def test_corrupt_cache_file(temp_dir: pathlib.Path):
+    """
+    Test that a corrupt cache file is discarded.
+    """
+
+    # Write garbage into the cache file
+    (temp_dir / ".git" / "clony_hash_cache").write_bytes(b"not a pickle")
+
+    # Assert that lookups treat the cache as empty
+    assert get_cached_hash(temp_dir, ("some/file.txt", 1, 2, 3)) is None
+
+
+# Test for an unwritable cache file
+@pytest.mark.unit
+def test_unwritable_cache_file(temp_dir: pathlib.Path):
+    """
+    Test that a cache that cannot be persisted is tolerated.
+    """
+
+    # Make persisting the cache fail
+    with patch.object(pathlib.Path, "write_bytes", side_effect=OSError):
+        store_hash(temp_dir, ("some/file.txt", 1, 2, 3), "c" * 40)
+        flush_hash_cache(temp_dir)
+
+    # Assert that the in-process cache still holds the entry
+    assert get_cached_hash(temp_dir, ("some/file.txt", 1, 2, 3)) == "c" * 40
+
+
+# Test for least-recently-used eviction
+@pytest.mark.unit
+def test_lru_eviction(temp_dir: pathlib.Path, monkeypatch):
+    """
+    Test that the oldest entries are evicted beyond the size bound.
+    """
+
+    # Bound the cache at two entries
+    monkeypatch.setattr(hash_cache, "MAX_CACHE_ENTRIES", 2)
+
+    # Store three hashes, touching the first one in between
+    store_hash(temp_dir, ("first.txt", 1, 1, 1), "a" * 40)
+    store_hash(temp_dir, ("second.txt", 2, 2, 2), "b" * 40)
+    assert get_cached_hash(temp_dir, ("first.txt", 1, 1, 1)) == "a" * 40
+    store_hash(temp_dir, ("third.txt", 3, 3, 3), "c" * 40)
+
+    # Assert that the least recently used entry was evicted
+    assert get_cached_hash(temp_dir, ("second.txt", 2, 2, 2)) is None
+    assert get_cached_hash(temp_dir, ("first.txt", 1, 1, 1)) == "a" * 40
+    assert get_cached_hash(temp_dir, ("third.txt", 3, 3, 3)) == "c" * 40
+
+
+# Test for the process-exit flush of dirty caches
+@pytest.mark.unit
+def test_flush_all(temp_dir: pathlib.Path):
+    """
+    Test that the exit hook flushes every repository with unsaved entries.
+    """
+
+    # Store a hash without flushing
+    store_hash(temp_dir, ("some/file.txt", 1, 2, 3), "d" * 40)
+
+    # Run the exit hook and assert that the cache landed on disk
+    hash_cache._flush_all()
+    assert (temp_dir / ".git" / "clony_hash_cache").exists()
+
+    # A dirty mark without a loaded cache is discarded without writing
+    hash_cache._dirty_repos.add(str(temp_dir / "gone"))
+    hash_cache._flush_all()
+    assert not (temp_dir / "gone" / ".git" / "clony_hash_cache").exists()
@@ -7,24 +7,33 @@ and commit objects.
 
 # Standard library imports
 import hashlib
+import os
 import pathlib
 import shutil
 import stat
 import tempfile
 import zlib
 from typing import Generator
+from unittest.mock import patch
 
 # Third-party imports
 import pytest
 
 # Local imports
 from clony.core.objects import (
+    LARGE_BLOB_THRESHOLD,
+    _emit_tree_content,
+    _write_object_chunks,
+    build_tree_from_index,
     calculate_sha1_hash,
+    calculate_sha1_hash_of_file,
     compress_content,
     create_blob_object,
     create_commit_object,
     create_tree_object,
     parse_tree_object,
+    read_tree_entries,
+    write_blob_object_streaming,
     write_object_file,
 )
 from clony.core.repository import Repository
@@ -70,6 +79,53 @@ def test_calculate_sha1_hash():
     assert sha1_hash == expected_hash
 
 
+# Test for calculate_sha1_hash_of_file function
+@pytest.mark.unit
+def test_calculate_sha1_hash_of_file(temp_dir: pathlib.Path):
+    """
+    Test the calculate_sha1_hash_of_file function.
+    """
+
+    # Create a test file
+    test_file_path = temp_dir / "test_file.txt"
+    test_content = b"test content for file hashing"
+    test_file_path.write_bytes(test_content)
+
+    # Define a test header
+    header = f"blob {len(test_content)}\0".encode()
+
+    # Calculate the SHA-1 hash using the function
+    sha1_hash = calculate_sha1_hash_of_file(test_file_path, header)
+
+    # Assert that the hash matches hashing the header and content directly
+    assert sha1_hash == hashlib.sha1(header + test_content).hexdigest()
+
+
+# Test for calculate_sha1_hash_of_file function without file_digest
+@pytest.mark.unit
+def test_calculate_sha1_hash_of_file_fallback(temp_dir: pathlib.Path, monkeypatch):
+    """
+    Test the calculate_sha1_hash_of_file chunked fallback path.
+    """
+
+    # Create a test file
+    test_file_path = temp_dir / "test_file.txt"
+    test_content = b"test content for the fallback path"
+    test_file_path.write_bytes(test_content)
+
+    # Define a test header
+    header = f"blob {len(test_content)}\0".encode()
+
+    # Remove file_digest to exercise the chunked fallback
+    monkeypatch.delattr(hashlib, "file_digest")
+
+    # Calculate the SHA-1 hash using the function
+    sha1_hash = calculate_sha1_hash_of_file(test_file_path, header)
+
+    # Assert that the hash matches hashing the header and content directly
+    assert sha1_hash == hashlib.sha1(header + test_content).hexdigest()
+
+
 # Test for compress_content function
 @pytest.mark.unit
 def test_compress_content():
@@ -83,11 +139,28 @@ def test_compress_content():
     # Compress the content using the function
     compressed_content = compress_content(content)
 
-    # Compress the content using zlib directly
-    expected_compressed = zlib.compress(content)
+    # Assert that stock zlib can round-trip the compressed content
+    assert zlib.decompress(compressed_content) == content
+
+
+# Test for compress_content producing standalone streams
+@pytest.mark.unit
+def test_compress_content_standalone_streams():
+    """
+    Test that every compress_content call yields a standalone zlib stream.
+
+    Object readers rely on zlib.decompress, which requires a complete
+    stream with header and checksum per object; sharing compressor state
+    across objects (e.g. flushing with Z_FULL_FLUSH) would break them.
+    """
+
+    # Compress two contents back to back
+    first = compress_content(b"first object content")
+    second = compress_content(b"second object content")
 
-    # Assert that the compressed content matches the expected compressed content
-    assert compressed_content == expected_compressed
+    # Assert that each stream decompresses independently
+    assert zlib.decompress(first) == b"first object content"
+    assert zlib.decompress(second) == b"second object content"
 
 
 # Test for write_object_file function
@@ -124,6 +197,245 @@ def test_write_object_file(temp_dir: pathlib.Path):
     # Assert that the decompressed content matches the original content with header
     assert decompressed_content == store_content
 
+    # Write the same object again to exercise the already-exists path
+    assert write_object_file(temp_dir, content, object_type) == sha1_hash
+
+
+# Test for _write_object_chunks function
+@pytest.mark.unit
+def test_write_object_chunks(temp_dir: pathlib.Path):
+    """
+    Test the _write_object_chunks function.
+    """
+
+    # Define the object file path and content chunks
+    object_file_path = temp_dir / "object_file"
+    chunks = [b"first chunk ", b"second chunk"]
+
+    # Write the chunks
+    _write_object_chunks(object_file_path, chunks)
+
+    # Assert that the object file holds the joined chunks
+    assert object_file_path.read_bytes() == b"first chunk second chunk"
+
+    # Write again to exercise the already-linked case
+    _write_object_chunks(object_file_path, chunks)
+    assert object_file_path.read_bytes() == b"first chunk second chunk"
+
+
+# Test for _write_object_chunks function fast path link
+@pytest.mark.unit
+def test_write_object_chunks_link(temp_dir: pathlib.Path, monkeypatch):
+    """
+    Test the _write_object_chunks O_TMPFILE link into the final name.
+    """
+
+    # Skip on platforms without O_TMPFILE
+    if not hasattr(os, "O_TMPFILE"):
+        pytest.skip("O_TMPFILE is not available on this platform")
+
+    # Define the object file path and content chunks
+    object_file_path = temp_dir / "object_file"
+    link_calls = []
+
+    # Record the link call instead of relying on /proc support
+    monkeypatch.setattr(
+        "clony.core.objects.os.link", lambda src, dst: link_calls.append((src, dst))
+    )
+
+    # Write the chunks through the fast path
+    _write_object_chunks(object_file_path, [b"linked content"])
+
+    # Assert that the anonymous file was linked into the final name
+    assert link_calls and link_calls[0][1] == str(object_file_path)
+
+
+# Test for _write_object_chunks function completing a short vectored write
+@pytest.mark.unit
+def test_write_object_chunks_short_write(temp_dir: pathlib.Path, monkeypatch):
+    """
+    Test that _write_object_chunks loops until a short writev completes.
+    """
+
+    # Skip on platforms without O_TMPFILE
+    if not hasattr(os, "O_TMPFILE"):
+        pytest.skip("O_TMPFILE is not available on this platform")
+
+    # Define the object file path and content chunks
+    object_file_path = temp_dir / "object_file"
+    chunks = [b"first chunk ", b"second chunk"]
+    linked_sizes = []
+
+    # Write at most five bytes per call to force short writes
+    real_write = os.write
+
+    def short_writev(fd, buffers):
+        return real_write(fd, bytes(buffers[0])[:5])
+
+    monkeypatch.setattr("clony.core.objects.os.writev", short_writev)
+
+    # Record the anonymous file's size at link time instead of relying
+    # on /proc support
+    monkeypatch.setattr(
+        "clony.core.objects.os.link",
+        lambda src, dst: linked_sizes.append(
+            os.fstat(int(src.rsplit("/", 1)[1])).st_size
+        ),
+    )
+
+    # Write the chunks through the fast path
+    _write_object_chunks(object_file_path, chunks)
+
+    # Assert that every byte reached the file before it was linked
+    assert linked_sizes == [len(b"".join(chunks))]
+
+
+# Test for _write_object_chunks function with an already existing object
+@pytest.mark.unit
+def test_write_object_chunks_already_exists(temp_dir: pathlib.Path, monkeypatch):
+    """
+    Test _write_object_chunks when the object file already exists.
+    """
+
+    # Skip on platforms without O_TMPFILE
+    if not hasattr(os, "O_TMPFILE"):
+        pytest.skip("O_TMPFILE is not available on this platform")
+
+    # Define the object file path and content chunks
+    object_file_path = temp_dir / "object_file"
+
+    # Make the link call report an already existing object
+    def raise_file_exists(src, dst):
+        raise FileExistsError
+
+    monkeypatch.setattr("clony.core.objects.os.link", raise_file_exists)
+
+    # Write the chunks; the existing object is left untouched
+    _write_object_chunks(object_file_path, [b"duplicate content"])
+
+    # Assert that no fallback file was written
+    assert not object_file_path.exists()
+
+
+# Test for _write_object_chunks function when linking is unsupported
+@pytest.mark.unit
+def test_write_object_chunks_link_unsupported(temp_dir: pathlib.Path, monkeypatch):
+    """
+    Test _write_object_chunks when linking the anonymous file fails.
+    """
+
+    # Skip on platforms without O_TMPFILE
+    if not hasattr(os, "O_TMPFILE"):
+        pytest.skip("O_TMPFILE is not available on this platform")
+
+    # Define the object file path and content chunks
+    object_file_path = temp_dir / "object_file"
+
+    # Make the link call fail so the portable fallback is used
+    def raise_os_error(src, dst):
+        raise OSError
+
+    monkeypatch.setattr("clony.core.objects.os.link", raise_os_error)
+
+    # Write the chunks through the portable fallback
+    _write_object_chunks(object_file_path, [b"unlinkable content"])
+
+    # Assert that the object file holds the content
+    assert object_file_path.read_bytes() == b"unlinkable content"
+
+
+# Test for _write_object_chunks function fallback paths
+@pytest.mark.unit
+def test_write_object_chunks_fallback(temp_dir: pathlib.Path, monkeypatch):
+    """
+    Test the _write_object_chunks portable fallback paths.
+    """
+
+    # Define the object file path and content chunks
+    object_file_path = temp_dir / "object_file"
+    chunks = [b"fallback content"]
+
+    # Simulate a platform without O_TMPFILE
+    monkeypatch.delattr(os, "O_TMPFILE", raising=False)
+
+    # Write the chunks through the portable path
+    _write_object_chunks(object_file_path, chunks)
+
+    # Assert that the object file holds the content
+    assert object_file_path.read_bytes() == b"fallback content"
+
+
+# Test for _write_object_chunks function with an unsupported filesystem
+@pytest.mark.unit
+def test_write_object_chunks_tmpfile_unsupported(temp_dir: pathlib.Path):
+    """
+    Test _write_object_chunks when the filesystem rejects O_TMPFILE.
+    """
+
+    # Define the object file path and content chunks
+    object_file_path = temp_dir / "object_file"
+    chunks = [b"tmpfile rejected"]
+
+    # Make os.open fail so the portable fallback is used
+    with patch("clony.core.objects.os.open", side_effect=OSError):
+        _write_object_chunks(object_file_path, chunks)
+
+    # Assert that the object file holds the content
+    assert object_file_path.read_bytes() == b"tmpfile rejected"
+
+
+# Test for _emit_tree_content function
+@pytest.mark.unit
+def test_emit_tree_content():
+    """
+    Test the _emit_tree_content function.
+    """
+
+    # Define parallel arrays for two entries
+    entry_modes = [b"100644", b"40000"]
+    entry_names = [b"file.txt", b"subdir"]
+    entry_hashes = [b"\x01" * 20, b"\x02" * 20]
+
+    # Emit the tree body
+    tree_content = _emit_tree_content(entry_modes, entry_names, entry_hashes)
+
+    # Assert that the body concatenates the entries in Git's tree format
+    assert tree_content == (
+        b"100644 file.txt\0" + b"\x01" * 20 + b"40000 subdir\0" + b"\x02" * 20
+    )
+
+
+# Test for create_blob_object function hash cache reuse
+@pytest.mark.unit
+def test_create_blob_object_hash_cache(temp_dir: pathlib.Path):
+    """
+    Test that create_blob_object reuses cached hashes for unchanged files.
+    """
+
+    # Initialize a repository
+    repo = Repository(str(temp_dir))
+    repo.init()
+
+    # Create a test file
+    test_file_path = temp_dir / "test_file.txt"
+    test_file_path.write_text("cached blob content")
+
+    # Create the blob object once to populate the cache
+    sha1_hash = create_blob_object(temp_dir, test_file_path)
+
+    # Create it again with hashing disabled to prove the cache is used
+    with patch("clony.core.objects.write_object_file") as mock_write:
+        assert create_blob_object(temp_dir, test_file_path) == sha1_hash
+        mock_write.assert_not_called()
+
+    # Remove the object file so the cached hash can no longer be trusted
+    object_file_path = temp_dir / ".git" / "objects" / sha1_hash[:2] / sha1_hash[2:]
+    object_file_path.unlink()
+
+    # Assert that the blob is re-created when the object file is missing
+    assert create_blob_object(temp_dir, test_file_path) == sha1_hash
+    assert object_file_path.exists()
+
 
 # Test for create_blob_object function
 @pytest.mark.unit
@@ -159,6 +471,73 @@ def test_create_blob_object(temp_dir: pathlib.Path):
     assert object_file_path.exists()
 
 
+# Test for create_blob_object function with a large file
+@pytest.mark.unit
+def test_create_blob_object_large_file(temp_dir: pathlib.Path):
+    """
+    Test the create_blob_object function with a file above the mmap threshold.
+    """
+
+    # Initialize a repository
+    repo = Repository(str(temp_dir))
+    repo.init()
+
+    # Create a test file larger than the streaming threshold
+    test_file_path = temp_dir / "large_file.bin"
+    test_content = b"large blob content\n" * (LARGE_BLOB_THRESHOLD // 16)
+    test_file_path.write_bytes(test_content)
+
+    # Create a blob object
+    sha1_hash = create_blob_object(temp_dir, test_file_path)
+
+    # Calculate expected SHA-1 hash
+    header = f"blob {len(test_content)}\0".encode()
+    store_content = header + test_content
+    expected_hash = hashlib.sha1(store_content).hexdigest()
+
+    # Assert that the returned hash matches the expected hash
+    assert sha1_hash == expected_hash
+
+    # Assert that the object file was created
+    object_file_path = temp_dir / ".git" / "objects" / sha1_hash[:2] / sha1_hash[2:]
+    assert object_file_path.exists()
+
+    # Read the object file and decompress it
+    with open(object_file_path, "rb") as f:
+        compressed_content = f.read()
+    decompressed_content = zlib.decompress(compressed_content)
+
+    # Assert that the decompressed content matches the original content with header
+    assert decompressed_content == store_content
+
+
+# Test for write_blob_object_streaming function with an existing object
+@pytest.mark.unit
+def test_write_blob_object_streaming_existing_object(temp_dir: pathlib.Path):
+    """
+    Test the write_blob_object_streaming function when the object already exists.
+    """
+
+    # Initialize a repository
+    repo = Repository(str(temp_dir))
+    repo.init()
+
+    # Create a test file
+    test_file_path = temp_dir / "large_file.bin"
+    test_file_path.write_bytes(b"streamed blob content\n" * 1024)
+
+    # Write the blob object twice
+    first_hash = write_blob_object_streaming(temp_dir, test_file_path)
+    second_hash = write_blob_object_streaming(temp_dir, test_file_path)
+
+    # Assert that both calls return the same hash
+    assert first_hash == second_hash
+
+    # Assert that the object file exists
+    object_file_path = temp_dir / ".git" / "objects" / first_hash[:2] / first_hash[2:]
+    assert object_file_path.exists()
+
+
 # Test for create_tree_object function
 @pytest.mark.unit
 def test_create_tree_object(temp_dir: pathlib.Path):
@@ -241,7 +620,7 @@ def test_create_tree_object_with_executable(temp_dir: pathlib.Path):
 
 # Test for create_tree_object function with executable file
 @pytest.mark.unit
-def test_create_tree_object_with_executable_file(temp_dir: pathlib.Path, monkeypatch):
+def test_create_tree_object_with_executable_file(temp_dir: pathlib.Path):
     """
     Test creating a tree object with an executable file.
     """
@@ -250,23 +629,8 @@ def test_create_tree_object_with_executable_file(temp_dir: pathlib.Path, monkeyp
     test_file = temp_dir / "script.sh"
     test_file.write_text("#!/bin/bash\necho 'Hello, World!'")
 
-    # Mock the stat method for Windows
-    def mock_stat(*args, **kwargs):
-        class MockStat:
-            st_mode = stat.S_IFREG | stat.S_IRUSR | stat.S_IWUSR | stat.S_IXUSR
-
-        return MockStat()
-
-    # Store the original stat method
-    original_stat = pathlib.Path.stat
-
-    def patched_stat(self, *args, **kwargs):
-        if str(self) == str(test_file):
-            return mock_stat()
-        return original_stat(self, *args, **kwargs)
-
-    # Patch the stat method of Path
-    monkeypatch.setattr(pathlib.Path, "stat", patched_stat)
+    # Make the file executable
+    test_file.chmod(test_file.stat().st_mode | stat.S_IXUSR)
 
     # Create the tree object
     tree_hash = create_tree_object(temp_dir, temp_dir)
@@ -280,6 +644,149 @@ def test_create_tree_object_with_executable_file(temp_dir: pathlib.Path, monkeyp
     assert b"100755" in content, "Executable file mode not found in tree object"
 
 
+# Test for read_tree_entries function with a missing tree object
+@pytest.mark.unit
+def test_read_tree_entries_missing_object(temp_dir: pathlib.Path):
+    """
+    Test the read_tree_entries function when the tree object does not exist.
+    """
+
+    # Initialize a repository
+    repo = Repository(str(temp_dir))
+    repo.init()
+
+    # Assert that a missing tree object yields no entries
+    assert read_tree_entries(temp_dir, "0" * 40) == []
+
+
+# Test for build_tree_from_index function
+@pytest.mark.unit
+def test_build_tree_from_index(temp_dir: pathlib.Path):
+    """
+    Test the build_tree_from_index function without a parent tree.
+    """
+
+    # Initialize a repository
+    repo = Repository(str(temp_dir))
+    repo.init()
+
+    # Create staged files, including a nested file and an executable
+    top_file = temp_dir / "top.txt"
+    top_file.write_text("top content")
+    subdir = temp_dir / "subdir"
+    subdir.mkdir()
+    nested_file = subdir / "nested.txt"
+    nested_file.write_text("nested content")
+    script_file = temp_dir / "script.sh"
+    script_file.write_text("#!/bin/bash\necho 'Hello, World!'")
+    script_file.chmod(script_file.stat().st_mode | stat.S_IXUSR)
+
+    # Define the index entries, mixing absolute and relative paths and
+    # including a staged path that falls outside the repository
+    dummy_hash = "ab" * 20
+    index_dict = {
+        str(top_file): dummy_hash,
+        "subdir/nested.txt": dummy_hash,
+        "script.sh": dummy_hash,
+        "/outside/elsewhere.txt": dummy_hash,
+    }
+
+    # Build the root tree from the index
+    tree_hash = build_tree_from_index(temp_dir, None, index_dict)
+
+    # Read back the tree entries
+    entries = {
+        name: (mode, obj_type)
+        for mode, obj_type, _, name in read_tree_entries(temp_dir, tree_hash)
+    }
+
+    # Assert that only the in-repository paths were recorded
+    assert set(entries) == {"top.txt", "subdir", "script.sh"}
+
+    # Assert that the entry types and modes are correct
+    assert entries["top.txt"] == ("100644", "blob")
+    assert entries["script.sh"] == ("100755", "blob")
+    assert entries["subdir"] == ("40000", "tree")
+
+
+# Test for build_tree_from_index function with a parent tree
+@pytest.mark.unit
+def test_build_tree_from_index_with_parent_tree(temp_dir: pathlib.Path):
+    """
+    Test that build_tree_from_index reuses unchanged subtrees of the parent.
+    """
+
+    # Initialize a repository
+    repo = Repository(str(temp_dir))
+    repo.init()
+
+    # Create a file in a subdirectory and a top-level file
+    subdir = temp_dir / "subdir"
+    subdir.mkdir()
+    stable_file = subdir / "stable.txt"
+    stable_file.write_text("stable content")
+    top_file = temp_dir / "top.txt"
+    top_file.write_text("top content")
+
+    # Build the first tree with both files staged
+    dummy_hash = "ab" * 20
+    first_tree = build_tree_from_index(
+        temp_dir, None, {"subdir/stable.txt": dummy_hash, "top.txt": dummy_hash}
+    )
+
+    # Record the hash of the subdirectory tree
+    first_entries = {
+        name: sha1_hash
+        for _, _, sha1_hash, name in read_tree_entries(temp_dir, first_tree)
+    }
+
+    # Modify only the top-level file and build the second tree
+    top_file.write_text("updated top content")
+    second_tree = build_tree_from_index(temp_dir, first_tree, {"top.txt": dummy_hash})
+
+    # Read back the second tree entries
+    second_entries = {
+        name: sha1_hash
+        for _, _, sha1_hash, name in read_tree_entries(temp_dir, second_tree)
+    }
+
+    # Assert that the unchanged subtree hash was reused as-is
+    assert second_entries["subdir"] == first_entries["subdir"]
+
+    # Assert that the top-level file entry changed
+    assert second_entries["top.txt"] != first_entries["top.txt"]
+
+    # Stage a new file inside the subdirectory and build a third tree
+    extra_file = subdir / "extra.txt"
+    extra_file.write_text("extra content")
+    third_tree = build_tree_from_index(
+        temp_dir, second_tree, {"subdir/extra.txt": dummy_hash}
+    )
+
+    # Read back the subdirectory tree entries
+    third_entries = {
+        name: sha1_hash
+        for _, _, sha1_hash, name in read_tree_entries(temp_dir, third_tree)
+    }
+    subdir_entries = {
+        name for _, _, _, name in read_tree_entries(temp_dir, third_entries["subdir"])
+    }
+
+    # Assert that the unchanged file was carried over from the parent subtree
+    assert subdir_entries == {"stable.txt", "extra.txt"}
+
+    # Stage a file that no longer exists on disk and build a fourth tree
+    ghost_hash = "cd" * 20
+    fourth_tree = build_tree_from_index(temp_dir, third_tree, {"ghost.txt": ghost_hash})
+
+    # Assert that the staged blob hash was kept for the missing file
+    fourth_entries = {
+        name: sha1_hash
+        for _, _, sha1_hash, name in read_tree_entries(temp_dir, fourth_tree)
+    }
+    assert fourth_entries["ghost.txt"] == ghost_hash
+
+
 # Test for create_commit_object function
 @pytest.mark.unit
 def test_create_commit_object(temp_dir: pathlib.Path):
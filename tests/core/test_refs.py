@@ -5,6 +5,7 @@ This module contains tests for the refs module, including HEAD and branch refere
 """
 
 # Standard library imports
+import os
 import pathlib
 import shutil
 import tempfile
@@ -23,6 +24,7 @@ from clony.core.refs import (
     get_head_ref,
     get_ref_hash,
     list_branches,
+    refs_snapshot,
     update_ref,
 )
 from clony.core.repository import Repository
@@ -201,6 +203,62 @@ def test_get_head_commit(temp_dir: pathlib.Path):
     assert head_commit == commit_hash
 
 
+# Test for refs_snapshot function
+@pytest.mark.unit
+def test_refs_snapshot(temp_dir: pathlib.Path):
+    """
+    Test the refs_snapshot function.
+    """
+
+    # Initialize a repository
+    repo = Repository(str(temp_dir))
+    repo.init()
+
+    # Before the first commit the reference resolves to no commit
+    head_ref, head_commit = refs_snapshot(temp_dir)
+    assert head_ref == "refs/heads/main"
+    assert head_commit is None
+
+    # Define a commit hash
+    commit_hash = "1234567890abcdef1234567890abcdef12345678"
+
+    # Update the main branch reference
+    update_ref(temp_dir, "refs/heads/main", commit_hash)
+
+    # Assert that the snapshot resolves the reference and the commit
+    assert refs_snapshot(temp_dir) == ("refs/heads/main", commit_hash)
+
+    # Detach HEAD onto the commit hash directly
+    head_file = temp_dir / ".git" / "HEAD"
+    with open(head_file, "w") as f:
+        f.write(commit_hash)
+
+    # Assert that a detached HEAD yields the hash for both values
+    assert refs_snapshot(temp_dir) == (commit_hash, commit_hash)
+
+
+# Test for refs_snapshot function without dir_fd support
+@pytest.mark.unit
+def test_refs_snapshot_no_dir_fd(temp_dir: pathlib.Path, monkeypatch):
+    """
+    Test the refs_snapshot fallback on platforms without dir_fd support.
+    """
+
+    # Initialize a repository
+    repo = Repository(str(temp_dir))
+    repo.init()
+
+    # Define a commit hash and update the main branch reference
+    commit_hash = "1234567890abcdef1234567890abcdef12345678"
+    update_ref(temp_dir, "refs/heads/main", commit_hash)
+
+    # Simulate a platform where os.open does not accept dir_fd
+    monkeypatch.setattr(os, "supports_dir_fd", set())
+
+    # Assert that the fallback resolves the reference and the commit
+    assert refs_snapshot(temp_dir) == ("refs/heads/main", commit_hash)
+
+
 # Test for create_branch function
 @pytest.mark.unit
 def test_create_branch(temp_dir: pathlib.Path):
@@ -25,6 +25,8 @@ from clony.internals.staging import (
     compress_content,
     has_file_changed_since_commit,
     is_file_already_staged,
+    pack_index_entry,
+    parse_index_entries,
     stage_file,
     update_index_file,
     write_object_file,
@@ -125,14 +127,14 @@ def test_update_index_file(temp_dir: pathlib.Path):
     file_path = "test_file_path"
 
     # Define test SHA-1 hash
-    sha1_hash = "test_sha1_hash"
+    sha1_hash = "1234567890abcdef1234567890abcdef12345678"
 
     # Update the index file
     update_index_file(index_file, file_path, sha1_hash)
 
     # Assert that the index file was updated
-    with open(index_file, "r") as f:
-        assert f"{file_path} {sha1_hash}\n" in f.read()
+    index_dict = parse_index_entries(index_file.read_bytes())
+    assert index_dict[file_path] == sha1_hash
 
 
 # Test for update_index_file function with existing entries
@@ -145,28 +147,35 @@ def test_update_index_file_with_existing_entries(temp_dir: pathlib.Path):
     # Define test index file
     index_file = temp_dir / "index"
 
+    # Define test SHA-1 hashes
+    hash1 = "abc1234567890abcdef1234567890abcdef12345"
+    hash2 = "def4564567890abcdef1234567890abcdef12345"
+    hash3 = "789abc4567890abcdef1234567890abcdef12345"
+
     # Create initial index content with multiple entries
-    initial_content = "file1.txt abc123\nfile2.txt def456\nfile3.txt ghi789\n"
-    index_file.write_text(initial_content)
+    initial_content = pack_index_entry("file1.txt", hash1)
+    initial_content += pack_index_entry("file2.txt", hash2)
+    initial_content += pack_index_entry("file3.txt", hash3)
+    index_file.write_bytes(initial_content)
 
     # Define test file path and SHA-1 hash
     file_path = "file2.txt"
-    sha1_hash = "new_hash_123"
+    sha1_hash = "0000000000abcdef1234567890abcdef12345678"
 
     # Update the index file
     update_index_file(index_file, file_path, sha1_hash)
 
     # Assert that the index file was updated correctly
-    with open(index_file, "r") as f:
-        content = f.read()
-        # Check that file1.txt entry is unchanged
-        assert "file1.txt abc123" in content
+    index_dict = parse_index_entries(index_file.read_bytes())
+
+    # Check that file1.txt entry is unchanged
+    assert index_dict["file1.txt"] == hash1
 
-        # Check that file2.txt entry is updated
-        assert "file2.txt new_hash_123" in content
+    # Check that file2.txt entry is updated
+    assert index_dict["file2.txt"] == sha1_hash
 
-        # Check that file3.txt entry is unchanged
-        assert "file3.txt ghi789" in content
+    # Check that file3.txt entry is unchanged
+    assert index_dict["file3.txt"] == hash3
 
 
 # Test for stage_file function
@@ -203,15 +212,12 @@ def test_stage_file(temp_dir: pathlib.Path):
 
     # Assert index file updated
     assert index_file_path.exists()
-    with open(index_file_path, "r") as index_file:
-        # Read index file content
-        index_content = index_file.read()
 
-        # Assert test file path in index content
-        assert str(test_file_path) in index_content
+    # Parse the binary index records
+    index_content = parse_index_entries(index_file_path.read_bytes())
 
-        # Assert SHA-1 hash in index content
-        assert sha1_hash in index_content
+    # Assert test file path in index content with the expected SHA-1 hash
+    assert index_content[str(test_file_path)] == sha1_hash
 
 
 # Test for stage_file function when no git repo is found
@@ -331,22 +337,28 @@ def test_is_file_already_staged(temp_dir: pathlib.Path):
     # Create a test index file
     index_file = temp_dir / "index"
 
+    # Define test SHA-1 hashes
+    hash1 = "1234567890abcdef1234567890abcdef12345678"
+    hash2 = "9876543210abcdef1234567890abcdef12345678"
+    different_hash = "0000000000abcdef1234567890abcdef12345678"
+
     # Test when index file doesn't exist
-    assert not is_file_already_staged(index_file, "test_file.txt", "hash123")
+    assert not is_file_already_staged(index_file, "test_file.txt", hash1)
 
-    # Create the index file with a test entry
-    with open(index_file, "w") as f:
-        f.write("test_file.txt hash123\n")
-        f.write("other_file.txt hash456\n")
+    # Create the index file with test entries
+    index_file.write_bytes(
+        pack_index_entry("test_file.txt", hash1)
+        + pack_index_entry("other_file.txt", hash2)
+    )
 
     # Test when file is in index with matching hash
-    assert is_file_already_staged(index_file, "test_file.txt", "hash123")
+    assert is_file_already_staged(index_file, "test_file.txt", hash1)
 
     # Test when file is in index with different hash
-    assert not is_file_already_staged(index_file, "test_file.txt", "different_hash")
+    assert not is_file_already_staged(index_file, "test_file.txt", different_hash)
 
     # Test when file is not in index
-    assert not is_file_already_staged(index_file, "non_existent_file.txt", "hash789")
+    assert not is_file_already_staged(index_file, "non_existent_file.txt", hash2)
 
 
 # Test for clear_staging_area function
@@ -373,18 +385,14 @@ def test_clear_staging_area(temp_dir: pathlib.Path):
 
     # Verify that the index file exists and has content
     assert index_file.exists()
-    with open(index_file, "r") as f:
-        content = f.read()
-    assert content.strip() != ""
+    assert index_file.read_bytes() != b""
 
     # Clear the staging area
     clear_staging_area(temp_dir)
 
     # Verify that the index file exists but is empty
     assert index_file.exists()
-    with open(index_file, "r") as f:
-        content = f.read()
-    assert content.strip() == ""
+    assert index_file.read_bytes() == b""
 
 
 # Test for has_file_changed_since_commit function
@@ -566,8 +574,7 @@ def test_has_file_changed_since_commit_missing_object_file(temp_dir: pathlib.Pat
 
     # Create the index file with the test file entry
     index_file = temp_dir / ".git" / "index"
-    with open(index_file, "w") as f:
-        f.write(f"{str(test_file_path)} {content_hash}\n")
+    index_file.write_bytes(pack_index_entry(str(test_file_path), content_hash))
 
     # Create the objects directory structure but not the object file itself
     objects_dir = temp_dir / ".git" / "objects"
@@ -425,7 +425,8 @@ def test_get_commit_tree():
     with (
         patch("pathlib.Path.exists", side_effect=[True, True]),
         patch(
-            "clony.internals.status.read_index_file", return_value={"file.txt": "hash1"}
+            "clony.internals.status.read_head_tree_file",
+            return_value={"file.txt": "hash1"},
         ),
     ):
         result = get_commit_tree(repo_path, "abcdef")
@@ -435,7 +436,7 @@ def test_get_commit_tree():
     with (
         patch("pathlib.Path.exists", side_effect=[True, True]),
         patch(
-            "clony.internals.status.read_index_file",
+            "clony.internals.status.read_head_tree_file",
             side_effect=Exception("Test error"),
         ),
     ):
@@ -628,7 +629,8 @@ def test_get_commit_tree_with_head_tree():
     with (
         patch("pathlib.Path.exists", side_effect=[True, True, True]),
         patch(
-            "clony.internals.status.read_index_file", return_value={"file.txt": "hash1"}
+            "clony.internals.status.read_head_tree_file",
+            return_value={"file.txt": "hash1"},
         ),
     ):
         result = get_commit_tree(repo_path, commit_hash)
@@ -672,7 +674,7 @@ def test_get_commit_tree_with_head_tree_error():
     with (
         patch("pathlib.Path.exists", side_effect=[True, True]),
         patch(
-            "clony.internals.status.read_index_file",
+            "clony.internals.status.read_head_tree_file",
             side_effect=Exception("Test error"),
         ),
         patch("clony.internals.status.logger.error") as mock_logger,
@@ -14,12 +14,26 @@ import pytest
 from rich.logging import RichHandler
 
 # Local imports
-from clony.utils.logger import _remove_handlers, setup_logger
+from clony.utils.logger import _configure_for_env, _remove_handlers, setup_logger
+
+
+# Module-scoped fixture sharing one configured logger across tests
+@pytest.fixture(scope="module")
+def base_logger() -> logging.Logger:
+    """
+    Return a logger configured once for the default-settings tests.
+
+    Returns:
+        logging.Logger: The logger configured by setup_logger.
+    """
+
+    # Configure the shared test logger once per module
+    return setup_logger("test_logger")
 
 
 # Test logger creation
 @pytest.mark.unit
-def test_logger_creation():
+def test_logger_creation(base_logger: logging.Logger):
     """
     Test that a logger is created with the correct name and level.
 
@@ -27,8 +41,8 @@ def test_logger_creation():
     with the specified name and the default INFO level.
     """
 
-    # Create a test logger
-    logger = setup_logger("test_logger")
+    # Use the shared test logger
+    logger = base_logger
 
     # Check logger name
     assert logger.name == "test_logger"
@@ -58,7 +72,7 @@ def test_logger_custom_level():
 
 # Test logger handler configuration
 @pytest.mark.unit
-def test_logger_handler_configuration():
+def test_logger_handler_configuration(base_logger: logging.Logger):
     """
     Test that the logger is configured with the correct Rich handler.
 
@@ -66,8 +80,8 @@ def test_logger_handler_configuration():
     the handler is a RichHandler instance for colorful output.
     """
 
-    # Create a test logger
-    logger = setup_logger("test_logger")
+    # Use the shared test logger
+    logger = base_logger
 
     # Check that exactly one handler is configured
     assert len(logger.handlers) == 1
@@ -78,7 +92,7 @@ def test_logger_handler_configuration():
 
 # Test logger propagation in test environment
 @pytest.mark.unit
-def test_logger_propagation_test():
+def test_logger_propagation_test(base_logger: logging.Logger):
     """
     Test that logger propagation is enabled in test environments.
 
@@ -86,8 +100,8 @@ def test_logger_propagation_test():
     the logger's propagate property is set to True.
     """
 
-    # Create a test logger
-    logger = setup_logger("test_logger")
+    # Use the shared test logger
+    logger = base_logger
 
     # Check that propagation is enabled in test environments
     assert "pytest" in sys.modules
@@ -96,7 +110,7 @@ def test_logger_propagation_test():
 
 # Test logger propagation in non-test environment
 @pytest.mark.unit
-def test_logger_propagation_non_test():
+def test_logger_propagation_non_test(monkeypatch):
     """
     Test that logger propagation is disabled in non-test environments.
 
@@ -104,83 +118,47 @@ def test_logger_propagation_non_test():
     sys.modules and verifies that logger propagation is disabled.
     """
 
-    # Save the original sys.modules and logger state
-    original_modules = dict(sys.modules)
-    original_logger = logging.getLogger("clony")
-    original_propagate = original_logger.propagate
-    original_handlers = list(original_logger.handlers)
-
-    try:
-        # Remove pytest from sys.modules to simulate non-test environment
-        if "pytest" in sys.modules:
-            del sys.modules["pytest"]
+    # Remove pytest from sys.modules to simulate a non-test environment;
+    # monkeypatch restores just this one entry on teardown
+    monkeypatch.delitem(sys.modules, "pytest", raising=False)
 
-        # Reset the logger configuration
-        original_logger.propagate = False
-        original_logger.handlers.clear()
+    # Reset the main logger configuration for the duration of the test
+    main_clony_logger = logging.getLogger("clony")
+    monkeypatch.setattr(main_clony_logger, "propagate", False)
+    monkeypatch.setattr(main_clony_logger, "handlers", [])
 
-        # Create a test logger
-        logger = setup_logger("test_logger")
-
-        # Check that propagation is disabled
-        assert not logger.propagate
+    # Create a test logger
+    logger = setup_logger("test_logger")
 
-        # Create another logger to test the main logger configuration
-        main_logger = setup_logger()
-        assert not main_logger.propagate
+    # Check that propagation is disabled
+    assert not logger.propagate
 
-    finally:
-        # Restore the original sys.modules and logger state
-        sys.modules.clear()
-        sys.modules.update(original_modules)
-        original_logger.propagate = original_propagate
-        original_logger.handlers.clear()
-        original_logger.handlers.extend(original_handlers)
+    # Create another logger to test the main logger configuration
+    main_logger = setup_logger()
+    assert not main_logger.propagate
 
 
 # Test logger module initialization in non-test environment
 @pytest.mark.unit
-def test_logger_module_init_non_test():
+def test_logger_module_init_non_test(monkeypatch):
     """
     Test that the logger module initializes correctly in a non-test environment.
 
-    This test simulates a non-test environment and verifies that
-    the logger initializes with the correct propagation settings.
+    This test drives the initialization helper directly with the non-test
+    condition instead of re-importing the whole module.
     """
 
-    # Save the original sys.modules and logger state
-    original_modules = dict(sys.modules)
-    original_logger = logging.getLogger("clony")
-    original_propagate = original_logger.propagate
-    original_handlers = list(original_logger.handlers)
-
-    try:
-        # Remove pytest from sys.modules to simulate non-test environment
-        if "pytest" in sys.modules:
-            del sys.modules["pytest"]
-
-        # Remove the logger module from sys.modules to force reinitialization
-        if "clony.utils.logger" in sys.modules:
-            del sys.modules["clony.utils.logger"]
+    # Reset the main logger configuration for the duration of the test
+    main_clony_logger = logging.getLogger("clony")
+    monkeypatch.setattr(main_clony_logger, "propagate", True)
+    monkeypatch.setattr(main_clony_logger, "handlers", [])
 
-        # Reset the logger configuration
-        original_logger.propagate = False
-        original_logger.handlers.clear()
+    # Run the initialization branch for a non-test environment
+    _configure_for_env(is_test=False)
 
-        # Import the logger module in a non-test environment
-        importlib.import_module("clony.utils.logger")
-
-        # Get the logger and check its configuration
-        logger = logging.getLogger("clony")
-        assert not logger.propagate
-
-    finally:
-        # Restore the original sys.modules and logger state
-        sys.modules.clear()
-        sys.modules.update(original_modules)
-        original_logger.propagate = original_propagate
-        original_logger.handlers.clear()
-        original_logger.handlers.extend(original_handlers)
+    # Check the resulting logger configuration
+    assert not main_clony_logger.propagate
+    assert len(main_clony_logger.handlers) == 1
 
 
 # Test rich handler settings
@@ -297,6 +275,56 @@ def test_logger_handler_removal():
         temp_logger.removeHandler(handler)
 
 
+# Test shared handler reuse between setup calls
+@pytest.mark.unit
+def test_setup_logger_shared_handler():
+    """
+    Test that repeated setup calls reuse the shared handler.
+
+    This test verifies that setup_logger attaches the same cached handler
+    instance instead of building a new one per call.
+    """
+
+    # Create two loggers at the same level
+    first_logger = setup_logger("shared_handler_logger_a")
+    second_logger = setup_logger("shared_handler_logger_b")
+
+    # Check that both loggers carry the same handler instance
+    assert first_logger.handlers[0] is second_logger.handlers[0]
+
+    # Call setup_logger again and check the handler is left in place
+    handler = first_logger.handlers[0]
+    again = setup_logger("shared_handler_logger_a")
+    assert again.handlers == [handler]
+
+
+# Test plain output mode via the CLONY_NO_COLOR environment variable
+@pytest.mark.unit
+def test_logger_plain_output(monkeypatch):
+    """
+    Test that CLONY_NO_COLOR switches the logger to a plain stream handler.
+
+    This test reloads the logger module with colors disabled and verifies
+    that a plain StreamHandler is used instead of a RichHandler.
+    """
+
+    # Disable colors and force the module to reinitialize; monkeypatch
+    # restores the module entry and logger handlers on teardown
+    monkeypatch.setenv("CLONY_NO_COLOR", "1")
+    monkeypatch.delitem(sys.modules, "clony.utils.logger", raising=False)
+    main_clony_logger = logging.getLogger("clony")
+    monkeypatch.setattr(main_clony_logger, "handlers", [])
+
+    # Import the logger module with colors disabled
+    logger_module = importlib.import_module("clony.utils.logger")
+
+    # Check that the clony logger got a plain stream handler
+    handler = logging.getLogger("clony").handlers[0]
+    assert isinstance(handler, logging.StreamHandler)
+    assert not isinstance(handler, RichHandler)
+    assert logger_module._plain_output
+
+
 # Test the _remove_handlers helper function
 @pytest.mark.unit
 def test_remove_handlers():